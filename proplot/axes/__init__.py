@@ -20,6 +20,9 @@ XYAxes, ProjAxes = warnings._rename_objs(
     ProjAxes=GeoAxes,
 )
 
+# List the wrapped methods in wrapper docstrings now that the axes are defined
+plot._format_wrapper_docs()
+
 mproj.register_projection(CartesianAxes)
 mproj.register_projection(PolarAxes)
 mproj.register_projection(BasemapAxes)
@@ -6,9 +6,11 @@ arguments documented by the wrapper function. In a future version, these feature
 be documented on the individual `~proplot.axes.Axes` methods themselves.
 """
 import functools
+import hashlib
 import inspect
 import re
 import sys
+import weakref
 from numbers import Integral, Number
 
 import matplotlib.artist as martist
@@ -37,10 +39,12 @@ from ..internals import (
     _flexible_getattr,
     _not_none,
     _state_context,
+    _version,
+    _version_mpl,
     docstring,
     warnings,
 )
-from ..utils import edges, edges2d, to_rgb, to_xyz, units
+from ..utils import edges, edges2d, to_xyz, units
 
 try:
     from cartopy.crs import PlateCarree
@@ -384,6 +388,34 @@ STYLE_ARGS_TRANSLATE = {
     'imshow': None,
 }
 
+# Flattened (colors, linewidths, linestyles) translations used by cmap_changer
+_STYLE_DISPATCH = {
+    name: None if style_kw is None else (
+        style_kw['colors'], style_kw['linewidths'], style_kw['linestyles']
+    )
+    for name, style_kw in STYLE_ARGS_TRANSLATE.items()
+}
+
+# Groups of plotting method names with special treatment in cmap_changer
+_CONTOUR_NAMES = frozenset(('contour', 'contourf', 'tricontour', 'tricontourf'))
+_CONTOUR_LINE_NAMES = frozenset(('contour', 'tricontour'))
+_CONTOUR_FILL_NAMES = frozenset(('contourf', 'tricontourf'))
+_CONTOUR_QUAD_NAMES = _CONTOUR_NAMES - frozenset(('tricontour', 'tricontourf'))
+_PCOLOR_NAMES = frozenset(('pcolor', 'pcolormesh', 'pcolorfast'))
+
+# Default label formatters keyed by precision and the zerotrim setting
+_SIMPLE_FORMATTERS = {}
+
+# Legend handle types interpreted as rows of centered-row legends
+_LIST_TYPES = (list, np.ndarray)
+
+# Wrapper functions whose docstrings list the methods they wrap
+_WRAPPER_DRIVERS = []
+
+# Alpha-blended colorbar colormaps keyed by the source colormap name, size, and
+# lookup table digest. Entries are dropped once no colorbar uses them.
+_BLENDED_CMAPS = weakref.WeakValueDictionary()
+
 
 def _is_number(data):
     """
@@ -1036,7 +1068,7 @@ def standardize_2d(
         y = y_index
 
     # Standardize coordinates
-    if name in ('pcolor', 'pcolormesh', 'pcolorfast'):
+    if name in _PCOLOR_NAMES:
         x, y = _enforce_edges(x, y, Zs[0])
     else:
         x, y = _enforce_centers(x, y, Zs[0])
@@ -2744,6 +2776,23 @@ def cycle_changer(
         return objs[0] if len(objs) == 1 else tuple(objs)
 
 
+def _remove_zero(levels):
+    """
+    Remove zero from a monotonic level list. Since zero can only appear once
+    this uses a binary search rather than a full boolean mask.
+    """
+    levels = np.asarray(levels)
+    descending = levels.size > 1 and levels[0] > levels[-1]
+    if descending:
+        levels = levels[::-1]
+    idx = np.searchsorted(levels, 0)
+    if idx < levels.size and levels[idx] == 0:
+        levels = np.concatenate((levels[:idx], levels[idx + 1:]))
+    if descending:
+        levels = levels[::-1]
+    return levels
+
+
 def _auto_levels_locator(
     *args, N=None, norm=None, norm_kw=None,
     vmin=None, vmax=None, extend='neither', locator=None, locator_kw=None,
@@ -2865,8 +2914,8 @@ def _auto_levels_locator(
         levels = norm.inverse(nlevels)
 
     # Filter the remaining contours
-    if nozero and 0 in levels:
-        levels = levels[levels != 0]
+    if nozero:
+        levels = _remove_zero(levels)
     if positive:
         levels = levels[levels >= 0]
     if negative:
@@ -2918,8 +2967,9 @@ def _build_discrete_norm(
     norm_kw = norm_kw or {}
     levels = _not_none(
         N=N, levels=levels, norm_kw_levels=norm_kw.pop('levels', None),
-        default=rc['image.levels']
     )
+    if levels is None:  # only look up the setting when needed
+        levels = rc['image.levels']
     vmin = _not_none(vmin=vmin, norm_kw_vmin=norm_kw.pop('vmin', None))
     vmax = _not_none(vmax=vmax, norm_kw_vmax=norm_kw.pop('vmax', None))
     if norm == 'segments':  # TODO: remove
@@ -3095,6 +3145,30 @@ def _labels_contour(self, obj, *args, fmt=None, **kwargs):
     return labs
 
 
+def _get_pcolor_centers(obj):
+    """
+    Return the bounding box centers of every pcolor box. This is vectorized
+    rather than calling `~matplotlib.path.Path.get_extents` on every path.
+    """
+    # Pcolormesh boxes are defined by the (ny + 1, nx + 1, 2) coordinate grid
+    if isinstance(obj, mcollections.QuadMesh):
+        coords = obj._coordinates
+        corners = np.stack(
+            (coords[:-1, :-1], coords[1:, :-1], coords[:-1, 1:], coords[1:, 1:])
+        )
+        centers = 0.5 * (corners.min(axis=0) + corners.max(axis=0))
+        return centers.reshape(-1, 2)
+    # Pcolor boxes are arbitrary paths, so reduce over their stacked vertices
+    paths = obj.get_paths()
+    if not paths:
+        return np.empty((0, 2))
+    vertices = np.concatenate([path.vertices for path in paths])
+    idxs = np.cumsum([0] + [len(path.vertices) for path in paths[:-1]])
+    return 0.5 * (
+        np.minimum.reduceat(vertices, idxs) + np.maximum.reduceat(vertices, idxs)
+    )
+
+
 def _labels_pcolor(self, obj, fmt=None, **kwargs):
     """
     Add labels to pcolor boxes with support for shade-dependent text colors.
@@ -3108,30 +3182,32 @@ def _labels_pcolor(self, obj, fmt=None, **kwargs):
 
     # Get positions and contour colors
     array = obj.get_array()
-    paths = obj.get_paths()
-    colors = np.asarray(obj.get_facecolors())
-    edgecolors = np.asarray(obj.get_edgecolors())
+    centers = _get_pcolor_centers(obj)
+    colors = obj.get_facecolors()  # already arrays, only read from
+    edgecolors = obj.get_edgecolors()
     if len(colors) == 1:  # weird flex but okay
-        colors = np.repeat(colors, len(array), axis=0)
+        colors = np.broadcast_to(colors, (len(array), colors.shape[1]))  # read-only
     if len(edgecolors) == 1:
-        edgecolors = np.repeat(edgecolors, len(array), axis=0)
+        edgecolors = np.broadcast_to(edgecolors, (len(array), edgecolors.shape[1]))
+
+    # Hide edges of invalid boxes in one go rather than one row at a time
+    # NOTE: This builds a new array, so the (possibly shared or broadcasted)
+    # input arrays are never modified. Masked data is treated as invalid.
+    valid = ma.filled(np.isfinite(array), False)
+    if len(edgecolors) == len(valid):
+        edgecolors = np.where(valid[:, None], edgecolors, 0.0)
+
+    # Get shade-dependent text colors for every box at once
+    if 'color' not in kwargs:
+        from ..internals import accel
+        lums = accel.luminance(colors)
 
     # Apply colors
     labs = []
-    for i, (color, path, num) in enumerate(zip(colors, paths, array)):
-        if not np.isfinite(num):
-            edgecolors[i, :] = 0
-            continue
-        bbox = path.get_extents()
-        x = (bbox.xmin + bbox.xmax) / 2
-        y = (bbox.ymin + bbox.ymax) / 2
+    for i in np.flatnonzero(valid):
+        (x, y), num = centers[i], array[i]
         if 'color' not in kwargs:
-            _, _, lum = to_xyz(color, 'hcl')
-            if lum < 50:
-                color = 'w'
-            else:
-                color = 'k'
-            labels_kw['color'] = color
+            labels_kw['color'] = 'w' if lums[i] < 50 else 'k'
         lab = self.text(x, y, fmt(num), **labels_kw)
         labs.append(lab)
     obj.set_edgecolors(edgecolors)
@@ -3230,17 +3306,15 @@ def cmap_changer(
     proplot.colors.DiscreteNorm
     """
     name = func.__name__
-    autoformat = rc['autoformat']  # possibly manipulated by standardize_[12]d
     if not args:
         return func(self, *args, **kwargs)
+    autoformat = rc['autoformat']  # possibly manipulated by standardize_[12]d
 
     # Mutable inputs
-    cmap_kw = cmap_kw or {}
-    norm_kw = norm_kw or {}
-    labels_kw = labels_kw or {}
-    locator_kw = locator_kw or {}
-    colorbar_kw = colorbar_kw or {}
-    norm_kw = norm_kw or {}
+    cmap_kw, norm_kw, labels_kw, locator_kw, colorbar_kw = (
+        cmap_kw or {}, norm_kw or {}, labels_kw or {}, locator_kw or {},
+        colorbar_kw or {},
+    )
 
     # Flexible user input
     # NOTE: For now when drawing contour or contourf plots with no colormap,
@@ -3248,7 +3322,7 @@ def cmap_changer(
     # NOTE: For now need to duplicate 'levels' parsing here and in
     # _build_discrete_norm so that it works with contour plots with no cmap.
     Z_sample = args[-1]
-    edgefix = _not_none(edgefix, rc['image.edgefix'])
+    edgefix = rc['image.edgefix'] if edgefix is None else edgefix
     linewidths = _not_none(lw=lw, linewidth=linewidth, linewidths=linewidths)
     linestyles = _not_none(ls=ls, linestyle=linestyle, linestyles=linestyles)
     colors = _not_none(
@@ -3256,8 +3330,9 @@ def cmap_changer(
     )
     levels = _not_none(
         N=N, levels=levels, norm_kw_levels=norm_kw.pop('levels', None),
-        default=rc['image.levels']
     )
+    if levels is None:  # only look up the setting when needed
+        levels = rc['image.levels']
 
     # Get colormap, but do not use cmap when 'colors' are passed to contour()
     # or to contourf() -- the latter only when 'linewidths' and 'linestyles'
@@ -3267,12 +3342,12 @@ def cmap_changer(
     # native matplotlib feature for manually coloring filled contours.
     # https://matplotlib.org/3.1.1/api/_as_gen/matplotlib.axes.Axes.contourf
     add_contours = (
-        name in ('contourf', 'tricontourf')
+        name in _CONTOUR_FILL_NAMES
         and (linewidths is not None or linestyles is not None)
     )
     uses_cmap = colors is None or (
-        name not in ('contour', 'tricontour')
-        and (name not in ('contourf', 'tricontourf') or add_contours)
+        name not in _CONTOUR_LINE_NAMES
+        and (name not in _CONTOUR_FILL_NAMES or add_contours)
     )
     no_discrete_norm = name in ('hexbin',)
     if not uses_cmap:
@@ -3282,7 +3357,7 @@ def cmap_changer(
                 f'colors={colors!r} instead.'
             )
             cmap = None
-        if name in ('contourf', 'tricontourf'):
+        if name in _CONTOUR_FILL_NAMES:
             kwargs['colors'] = colors  # this was not done above
             colors = None
     else:
@@ -3302,18 +3377,22 @@ def cmap_changer(
     # Translate standardized keyword arguments back into the keyword args
     # accepted by native matplotlib methods. Also disable edgefix if user want
     # to customize the "edges".
-    style_kw = STYLE_ARGS_TRANSLATE.get(name, None)
-    for key, value in (
-        ('colors', colors),
-        ('linewidths', linewidths),
-        ('linestyles', linestyles)
+    if not add_contours and (
+        colors is not None or linewidths is not None or linestyles is not None
     ):
-        if value is None or add_contours:
-            continue
-        if not style_kw or key not in style_kw:  # no known conversion table
+        style_keys = _STYLE_DISPATCH.get(name, None)
+        if style_keys is None:  # no known conversion table
+            key = 'colors' if colors is not None else (
+                'linewidths' if linewidths is not None else 'linestyles'
+            )
             raise TypeError(f'{name}() got an unexpected keyword argument {key!r}')
         edgefix = False  # disable edgefix when specifying borders!
-        kwargs[style_kw[key]] = value
+        if colors is not None:
+            kwargs[style_keys[0]] = colors
+        if linewidths is not None:
+            kwargs[style_keys[1]] = linewidths
+        if linestyles is not None:
+            kwargs[style_keys[2]] = linestyles
 
     # Build colormap normalizer and update keyword args
     # NOTE: Standard algorithm for obtaining default levels does not work
@@ -3325,17 +3404,20 @@ def cmap_changer(
             norm=norm, norm_kw=norm_kw, locator=locator, locator_kw=locator_kw,
             vmin=vmin, vmax=vmax, extend=extend, symmetric=symmetric,
         )
-    if uses_cmap and not no_discrete_norm:
+    if uses_cmap and not no_discrete_norm and isinstance(norm, mcolors.BoundaryNorm):
+        # Fast path for pre-built discrete normalizers. Levels are never generated
+        # for these (see _build_discrete_norm), so skip all the parsing.
+        levels = norm.boundaries
+    elif uses_cmap and not no_discrete_norm:
         norm, cmap, levels, ticks = _build_discrete_norm(
             Z_sample, levels=levels, values=values,
             cmap=cmap, norm=norm, norm_kw=norm_kw, vmin=vmin, vmax=vmax, extend=extend,
             symmetric=symmetric, positive=positive, negative=negative, nozero=nozero,
             locator=locator, locator_kw=locator_kw,
-            minlength=(1 if name in ('contour', 'tricontour') else 2),
+            minlength=(1 if name in _CONTOUR_LINE_NAMES else 2),
         )
-    if nozero and np.iterable(levels) and 0 in levels:
-        levels = np.asarray(levels)
-        levels = levels[levels != 0]
+    if nozero and np.iterable(levels):
+        levels = _remove_zero(levels)
     if cmap is not None:
         kwargs['cmap'] = cmap
     if norm is not None:
@@ -3343,9 +3425,20 @@ def cmap_changer(
     if no_discrete_norm:
         kwargs['vmin'] = vmin
         kwargs['vmax'] = vmax
-    if name in ('contour', 'contourf', 'tricontour', 'tricontourf'):
+    if name in _CONTOUR_NAMES:
         kwargs['levels'] = levels
         kwargs['extend'] = extend
+        if (
+            name in _CONTOUR_QUAD_NAMES
+            and _version_mpl >= _version('3.6')
+            and rc['contour.algorithm'] == 'mpl2014'
+        ):
+            # NOTE: The 'serial' contourpy engine is much faster than the default
+            # 'mpl2014' engine, so use it unless the user changed the algorithm.
+            # Also applies to the edges drawn for add_contours because
+            # self.contour is passed through this wrapper. Triangular contours
+            # do not accept an algorithm.
+            kwargs.setdefault('algorithm', 'serial')
     if name in ('parametric',):
         kwargs['values'] = values
 
@@ -3367,11 +3460,19 @@ def cmap_changer(
     # Apply labels
     # TODO: Add quiverkey to this!
     if labels:
-        fmt = _not_none(labels_kw.pop('fmt', None), fmt, 'simple')
-        fmt = constructor.Formatter(fmt, precision=precision)
-        if name in ('contour', 'contourf', 'tricontour', 'tricontourf'):
+        fmt = _not_none(labels_kw.pop('fmt', None), fmt)
+        if fmt is None:  # share default formatters between calls
+            key = (precision, rc['formatter.zerotrim'])
+            if key not in _SIMPLE_FORMATTERS:
+                _SIMPLE_FORMATTERS[key] = constructor.Formatter(
+                    'simple', precision=precision
+                )
+            fmt = _SIMPLE_FORMATTERS[key]
+        else:
+            fmt = constructor.Formatter(fmt, precision=precision)
+        if name in _CONTOUR_NAMES:
             _labels_contour(self, obj, *args, fmt=fmt, **labels_kw)
-        elif name in ('pcolor', 'pcolormesh', 'pcolorfast'):
+        elif name in _PCOLOR_NAMES:
             _labels_pcolor(self, obj, fmt=fmt, **labels_kw)
         else:
             raise RuntimeError(f'Not possible to add labels to {name!r} plot.')
@@ -3411,28 +3512,44 @@ def _generate_mappable(
         values = np.linspace(0, 1, cmap.N)
 
     # List of colors
-    elif np.iterable(mappable) and all(
-        isinstance(obj, str) or (np.iterable(obj) and len(obj) in (3, 4))
-        for obj in mappable
+    # NOTE: Here and below we dispatch on the first item and validate the
+    # remaining items inside the branch rather than scanning the list twice.
+    elif np.iterable(mappable) and len(mappable) and (
+        isinstance(mappable[0], str)
+        or np.iterable(mappable[0]) and len(mappable[0]) in (3, 4)
     ):
-        cmap = mcolors.ListedColormap(list(mappable), '_no_name')
+        try:
+            colors = mcolors.to_rgba_array(list(mappable))
+        except ValueError:
+            raise ValueError(f'Invalid list of colors {mappable!r}.')
+        cmap = mcolors.ListedColormap(colors, '_no_name')
         if values is None:
             values = np.arange(len(mappable))
         locator = _not_none(locator, values)  # tick *all* values by default
 
     # List of artists
     # NOTE: Do not check for isinstance(Artist) in case it is an mpl collection
-    elif np.iterable(mappable) and all(
-        hasattr(obj, 'get_color') or hasattr(obj, 'get_facecolor')
-        for obj in mappable
+    elif np.iterable(mappable) and len(mappable) and (
+        hasattr(mappable[0], 'get_color') or hasattr(mappable[0], 'get_facecolor')
     ):
         # Generate colormap from colors and infer tick labels
+        # NOTE: Resolve the color getter only when the artist type changes
+        # rather than calling hasattr twice for every artist.
         colors = []
+        cls = getter = None
         for obj in mappable:
-            if hasattr(obj, 'get_color'):
-                color = obj.get_color()
-            else:
-                color = obj.get_facecolor()
+            if type(obj) is not cls:
+                cls = type(obj)
+                if hasattr(obj, 'get_color'):
+                    getter = 'get_color'
+                elif hasattr(obj, 'get_facecolor'):
+                    getter = 'get_facecolor'
+                else:
+                    raise ValueError(
+                        'Cannot make colorbar from list of artists that includes '
+                        f'object without a color: {obj!r}.'
+                    )
+            color = getattr(obj, getter)()
             if isinstance(color, np.ndarray):
                 color = color.squeeze()  # e.g. scatter plot
                 if color.ndim != 1:
@@ -3440,26 +3557,27 @@ def _generate_mappable(
                         'Cannot make colorbar from list of artists '
                         f'with more than one color: {color!r}.'
                     )
-            colors.append(to_rgb(color))
+            colors.append(color)
+        colors = mcolors.to_rgba_array(colors)[:, :3].tolist()  # convert at once
 
         # Try to infer tick values and tick labels from Artist labels
         cmap = mcolors.ListedColormap(colors, '_no_name')
         if values is None:
             # Get object labels and values (avoid overwriting colorbar 'label')
-            labs = []
+            # NOTE: Labels starting with underscore are ignored by legend
+            labs = [
+                obj.get_label() or None if hasattr(obj, 'get_label') else None
+                for obj in mappable
+            ]
+            labs = [None if lab and lab[:1] == '_' else lab for lab in labs]
             values = []
-            for obj in mappable:
-                lab = value = None
-                if hasattr(obj, 'get_label'):
-                    lab = obj.get_label() or None
-                    if lab and lab[:1] == '_':  # intended to be ignored by legend
-                        lab = None
+            for lab in labs:
+                value = None
                 if lab:
                     try:
                         value = float(lab)
                     except (TypeError, ValueError):
                         pass
-                labs.append(lab)
                 values.append(value)
 
             # Use default values if labels are non-numeric (numeric labels are
@@ -3694,6 +3812,16 @@ or colormap-spec
         if value is not None:
             kw_ticklabels[key] = value
 
+    # Get the colorbar length in physical units. This is used for both the
+    # default tick spacing and the extension sizes.
+    # NOTE: Cannot use Axes.get_size_inches because this is a native matplotlib axes
+    width, height = self.figure.get_size_inches()
+    position = self.get_position()
+    if orientation == 'horizontal':
+        length = width * abs(position.width)
+    else:
+        length = height * abs(position.height)
+
     # Try to get tick locations from *levels* or from *values* rather than
     # random points along the axis.
     # NOTE: Do not necessarily want e.g. minor tick locations at logminor for LogNorm!
@@ -3714,16 +3842,11 @@ or colormap-spec
 
         elif not isinstance(locator, mticker.Locator):
             # Get default maxn, try to allot 2em squares per label maybe?
-            # NOTE: Cannot use Axes.get_size_inches because this is a
-            # native matplotlib axes
-            width, height = self.figure.get_size_inches()
             if orientation == 'horizontal':
                 scale = 3  # em squares alotted for labels
-                length = width * abs(self.get_position().width)
                 fontsize = kw_ticklabels.get('size', rc['xtick.labelsize'])
             else:
                 scale = 1
-                length = height * abs(self.get_position().height)
                 fontsize = kw_ticklabels.get('size', rc['ytick.labelsize'])
             fontsize = rc._scale_font(fontsize)
             maxn = _not_none(maxn, int(length / (scale * fontsize / 72)))
@@ -3737,13 +3860,11 @@ or colormap-spec
             locator = locator[::step]
 
     # Get extend triangles in physical units
-    width, height = self.figure.get_size_inches()
-    if orientation == 'horizontal':
-        scale = width * abs(self.get_position().width)
-    else:
-        scale = height * abs(self.get_position().height)
+    # NOTE: Clamp the fraction for tiny colorbars where the extensions would be
+    # longer than the colorbar itself. Otherwise get negative or huge fractions.
     extendsize = units(_not_none(extendsize, rc['colorbar.extend']))
-    extendsize = extendsize / (scale - 2 * extendsize)
+    extendsize = extendsize / max(length - 2 * extendsize, 0.1 * length, 1e-10)
+    extendsize = min(extendsize, 0.45)
 
     # Draw the colorbar
     # NOTE: Set default formatter here because we optionally apply a FixedFormatter
@@ -3822,17 +3943,25 @@ or colormap-spec
         warnings._warn_proplot(
             f'Using manual alpha-blending for {cmap.name!r} colorbar solids.'
         )
-        # Generate "secret" copy of the colormap!
-        lut = cmap._lut.copy()
-        cmap = mcolors.Colormap('_cbar_fix', N=cmap.N)
-        cmap._isinit = True
-        cmap._init = lambda: None
-        # Manually fill lookup table with alpha-blended RGB colors!
-        for i in range(lut.shape[0] - 1):
-            alpha = lut[i, 3]
-            lut[i, :3] = (1 - alpha) * 1 + alpha * lut[i, :3]  # blend *white*
-            lut[i, 3] = 1
-        cmap._lut = lut
+        # Generate "secret" copy of the colormap or reuse an existing copy
+        lut = cmap._lut
+        digest = hashlib.blake2b(lut.tobytes(), digest_size=8).digest()
+        key = (cmap.name, cmap.N, digest)
+        cmap = _BLENDED_CMAPS.get(key, None)
+        if cmap is None:
+            lut = lut.copy()
+            cmap = mcolors.Colormap('_cbar_fix', N=key[1])
+            cmap._isinit = True
+            cmap._init = lambda: None
+            # Manually fill lookup table with alpha-blended RGB colors!
+            # NOTE: Blend *white* in-place to avoid allocating temporary arrays. Keep
+            # the float64 lookup table dtype used by matplotlib colormaps.
+            rgb, alpha = lut[:-1, :3], lut[:-1, 3:]
+            np.multiply(rgb, alpha, out=rgb)
+            np.add(rgb, 1 - alpha, out=rgb)
+            alpha[...] = 1
+            cmap._lut = lut
+            _BLENDED_CMAPS[key] = cmap
         # Update colorbar
         cb.cmap = cmap
         cb.draw_all()
@@ -3842,10 +3971,9 @@ or colormap-spec
         'edgecolor': _not_none(edgecolor, rc['axes.edgecolor']),
         'linewidth': _not_none(linewidth, rc['axes.linewidth']),
     }
-    if cb.outline is not None:
-        cb.outline.update(kw_outline)
-    if cb.dividers is not None:
-        cb.dividers.update(kw_outline)
+    for obj in (cb.outline, cb.dividers):
+        if obj is not None:
+            _update_outline(obj, **kw_outline)
 
     # *Never* rasterize because it causes misalignment with border lines
     if cb.solids:
@@ -3862,18 +3990,50 @@ or colormap-spec
     return cb
 
 
+def _update_outline(obj, edgecolor, linewidth):
+    """
+    Update the edge color and line width of the colorbar outline or dividers,
+    skipping properties that already match to avoid marking the artist stale.
+    """
+    kw = {}
+    current = np.atleast_2d(obj.get_edgecolor())
+    if len(current) != 1 or not np.allclose(current[0], mcolors.to_rgba(edgecolor)):
+        kw['edgecolor'] = edgecolor
+    if np.any(np.asarray(obj.get_linewidth()) != linewidth):
+        kw['linewidth'] = linewidth
+    if kw:
+        obj.update(kw)
+
+
 def _iter_legend_children(children):
     """
     Iterate recursively through `_children` attributes of various `HPacker`,
     `VPacker`, and `DrawingArea` classes.
     """
-    for obj in children:
+    # NOTE: Use an explicit stack rather than recursive generators. Children
+    # are pushed in reverse so they are yielded in their original order.
+    stack = list(children)[::-1]
+    while stack:
+        obj = stack.pop()
         if hasattr(obj, '_children'):
-            yield from _iter_legend_children(obj._children)
+            stack.extend(obj._children[::-1])
         else:
             yield obj
 
 
+def _count_legend_points(self):
+    """
+    Return the number of data points that matplotlib checks for overlap when
+    searching for the "best" legend location.
+    """
+    count = 0
+    for line in self.lines:
+        count += len(line.get_xydata())
+    for coll in self.collections:
+        count += len(coll.get_offsets())
+    return count
+
+
 def _multiple_legend(self, pairs, loc=None, ncol=None, order=None, **kwargs):
     """
     Draw "legend" with centered rows by creating separate legends for
@@ -3914,7 +4074,6 @@ def _multiple_legend(self, pairs, loc=None, ncol=None, order=None, **kwargs):
     # NOTE: We confine possible bounding box in *y*-direction, but do not
     # confine it in *x*-direction. Matplotlib will automatically move
     # left-to-right if you request this.
-    ymin, ymax = None, None
     if order == 'F':
         raise NotImplementedError(
             'When center=True, ProPlot vertically stacks successive '
@@ -3933,40 +4092,44 @@ def _multiple_legend(self, pairs, loc=None, ncol=None, order=None, **kwargs):
             'Using "upper center" instead.'
         )
 
+    # Legend positions
+    # NOTE: The title is only drawn on the first sublegend, so subsequent
+    # sublegends are shifted by one row to add extra space.
+    npairs = len(pairs)
+    rows = np.arange(npairs)
+    if kwargs.get('title', None) is not None:
+        rows[1:] += 1
+    if 'upper' in loc:
+        y1s = 1 - (rows + 1) * interval
+        y2s = 1 - rows * interval
+    elif 'lower' in loc:
+        y1s = (npairs + rows - 2) * interval
+        y2s = (npairs + rows - 1) * interval
+    else:  # center
+        y1s = 0.5 + interval * npairs / 2 - (rows + 1) * interval
+        y2s = 0.5 + interval * npairs / 2 - rows * interval
+
     # Iterate through sublists
-    for i, ipairs in enumerate(pairs):
+    # NOTE: A single sublegend draws its own frame, so the renderer and the
+    # manual bounding box patch below are not needed.
+    single = npairs == 1
+    for i, (ipairs, y1, y2) in enumerate(zip(pairs, y1s, y2s)):
         if i == 1:
-            title = kwargs.pop('title', None)
-        if i >= 1 and title is not None:
-            i += 1  # add extra space!
-
-        # Legend position
-        if 'upper' in loc:
-            y1 = 1 - (i + 1) * interval
-            y2 = 1 - i * interval
-        elif 'lower' in loc:
-            y1 = (len(pairs) + i - 2) * interval
-            y2 = (len(pairs) + i - 1) * interval
-        else:  # center
-            y1 = 0.5 + interval * len(pairs) / 2 - (i + 1) * interval
-            y2 = 0.5 + interval * len(pairs) / 2 - i * interval
-        ymin = min(y1, _not_none(ymin, y1))
-        ymax = max(y2, _not_none(ymax, y2))
+            kwargs.pop('title', None)
 
         # Draw legend
         bbox = mtransforms.Bbox([[0, y1], [1, y2]])
+        handles = [handle for handle, _ in ipairs]
+        labels = [label for _, label in ipairs]
         leg = mlegend.Legend(
-            self, *zip(*ipairs), loc=loc, ncol=len(ipairs),
+            self, handles, labels, loc=loc, ncol=len(ipairs),
             bbox_transform=self.transAxes, bbox_to_anchor=bbox,
-            frameon=False, **kwargs
+            frameon=bool(frameon) and single, **kwargs
         )
         legs.append(leg)
 
     # Simple cases
-    if not frameon:
-        return legs
-    if len(legs) == 1:
-        legs[0].set_frame_on(True)
+    if not frameon or single:
         return legs
 
     # Draw manual fancy bounding box for un-aligned legend
@@ -3977,11 +4140,10 @@ def _multiple_legend(self, pairs, loc=None, ncol=None, order=None, **kwargs):
     # coordinates are messed up. In some tests all coordinates were just result
     # of get window extent multiplied by 2 (???). Anyway actual box is found in
     # _legend_box attribute, which is accessed by get_window_extent.
-    width, height = self.get_size_inches()
     renderer = self.figure._get_renderer()
+    transform = self.transAxes.inverted()
     bboxs = [
-        leg.get_window_extent(renderer).transformed(self.transAxes.inverted())
-        for leg in legs
+        transform.transform_bbox(leg.get_window_extent(renderer)) for leg in legs
     ]
     xmin = min(bbox.xmin for bbox in bboxs)
     xmax = max(bbox.xmax for bbox in bboxs)
@@ -3997,7 +4159,10 @@ def _multiple_legend(self, pairs, loc=None, ncol=None, order=None, **kwargs):
         mutation_scale=fontsize,
         transform=self.transAxes
     )
-    if kwargs.get('fancybox', rc['legend.fancybox']):
+    fancybox = kwargs.get('fancybox', None)
+    if fancybox is None:
+        fancybox = rc['legend.fancybox']
+    if fancybox:
         patch.set_boxstyle('round', pad=0, rounding_size=0.2)
     else:
         patch.set_boxstyle('square', pad=0)
@@ -4006,7 +4171,10 @@ def _multiple_legend(self, pairs, loc=None, ncol=None, order=None, **kwargs):
 
     # Add shadow
     # TODO: This does not work, figure out
-    if kwargs.get('shadow', rc['legend.shadow']):
+    shadow = kwargs.get('shadow', None)
+    if shadow is None:
+        shadow = rc['legend.shadow']
+    if shadow:
         shadow = mpatches.Shadow(patch, 20, -20)
         self.add_artist(shadow)
 
@@ -4023,18 +4191,16 @@ def _single_legend(self, pairs, ncol=None, order=None, **kwargs):
     # See: https://stackoverflow.com/q/10101141/4970632
     # Example: If 5 columns, but final row length 3, columns 0-2 have
     # N rows but 3-4 have N-1 rows.
+    # NOTE: Reading the row-major grid column-by-column is equivalent to
+    # slicing every ncol'th entry starting from each column index.
     ncol = _not_none(ncol, 3)
     if order == 'C':
-        split = [pairs[i * ncol:(i + 1) * ncol] for i in range(len(pairs) // ncol + 1)]
-        pairs = []
-        nrows_max = len(split)  # max possible row count
-        ncols_final = len(split[-1])  # columns in final row
-        nrows = [nrows_max] * ncols_final + [nrows_max - 1] * (ncol - ncols_final)
-        for col, nrow in enumerate(nrows):  # iterate through cols
-            pairs.extend(split[row][col] for row in range(nrow))
+        pairs = [pair for col in range(ncol) for pair in pairs[col::ncol]]
 
     # Draw legend
-    return mlegend.Legend(self, *zip(*pairs), ncol=ncol, **kwargs)
+    handles = [handle for handle, _ in pairs]
+    labels = [label for _, label in pairs]
+    return mlegend.Legend(self, handles, labels, ncol=ncol, **kwargs)
 
 
 def legend_wrapper(
@@ -4132,7 +4298,9 @@ property-spec, optional
         )
     ncol = _not_none(ncols=ncols, ncol=ncol)
     title = _not_none(label=label, title=title)
-    frameon = _not_none(frame=frame, frameon=frameon, default=rc['legend.frameon'])
+    frameon = _not_none(frame=frame, frameon=frameon)
+    if frameon is None:
+        frameon = rc['legend.frameon']
     if handles is not None and not np.iterable(handles):  # e.g. a mappable object
         handles = [handles]
     if labels is not None and (not np.iterable(labels) or isinstance(labels, str)):
@@ -4177,12 +4345,23 @@ property-spec, optional
     # NOTE: Avoid very common plot() error where users draw individual lines
     # with plot() and add singleton tuples to a list of handles. If matplotlib
     # gets a list like this but gets no 'labels' argument, it raises error.
-    list_of_lists = False
+    # NOTE: Normalize the handles, detect lists of lists, and check iterability
+    # in a single pass. Array sublists are converted to lists here.
+    list_of_lists = noniterable = False
     if handles is not None:
-        handles = [h[0] if isinstance(h, tuple) and len(h) == 1 else h for h in handles]
-        list_of_lists = any(isinstance(h, (list, np.ndarray)) for h in handles)
+        ihandles, handles = handles, []
+        for handle in ihandles:
+            if isinstance(handle, tuple) and len(handle) == 1:
+                handle = handle[0]
+            if isinstance(handle, _LIST_TYPES):
+                if isinstance(handle, np.ndarray):
+                    handle = handle.tolist()
+                list_of_lists = True
+            elif not noniterable and not np.iterable(handle):
+                noniterable = True
+            handles.append(handle)
     if list_of_lists:
-        if any(not np.iterable(_) for _ in handles):
+        if noniterable:
             raise ValueError(f'Invalid handles={handles!r}.')
         if not labels:
             labels = [None] * len(handles)
@@ -4192,8 +4371,6 @@ property-spec, optional
 
     # Parse handles and legends with native matplotlib parser
     if not list_of_lists:
-        if isinstance(handles, np.ndarray):
-            handles = handles.tolist()
         if isinstance(labels, np.ndarray):
             labels = labels.tolist()
         handles, labels, *_ = mlegend._parse_legend_args(
@@ -4203,8 +4380,6 @@ property-spec, optional
     else:
         pairs = []
         for ihandles, ilabels in zip(handles, labels):
-            if isinstance(ihandles, np.ndarray):
-                ihandles = ihandles.tolist()
             if isinstance(ilabels, np.ndarray):
                 ilabels = ilabels.tolist()
             ihandles, ilabels, *_ = mlegend._parse_legend_args(
@@ -4232,7 +4407,21 @@ property-spec, optional
     elif center:
         objs = _multiple_legend(self, pairs, loc=loc, ncol=ncol, order=order, **kwargs)
     # Individual legend
+    # NOTE: Matplotlib searches for the "best" location by checking overlap with
+    # every data point on every draw. Skip this for very large datasets.
     else:
+        bestmax = rc['legend.bestmax']
+        if (
+            bestmax is not None
+            and _not_none(loc, rc['legend.loc']) in ('best', 0)
+            and _count_legend_points(self) > bestmax
+        ):
+            warnings._warn_proplot(
+                f'Axes has more than {bestmax} data points. Using legend location '
+                "'upper right' instead of 'best'. Pass an explicit location or "
+                "change rc['legend.bestmax'] to suppress this warning."
+            )
+            loc = 'upper right'
         objs = [_single_legend(self, pairs, loc=loc, ncol=ncol, order=order, **kwargs)]
 
     # Add legends manually so matplotlib does not remove old ones
@@ -4245,16 +4434,16 @@ property-spec, optional
             self.add_artist(obj)
 
     # Apply legend box properties
+    # NOTE: Only look up settings that were not passed by the user
     outline = rc.fill({
-        'linewidth': 'axes.linewidth',
-        'edgecolor': 'axes.edgecolor',
-        'facecolor': 'axes.facecolor',
-        'alpha': 'legend.framealpha',
+        key: name for key, name in (
+            ('linewidth', 'axes.linewidth'),
+            ('edgecolor', 'axes.edgecolor'),
+            ('facecolor', 'axes.facecolor'),
+            ('alpha', 'legend.framealpha'),
+        )
+        if key == 'linewidth' or not kwargs.get(key, None)
     })
-    for key in (*outline,):
-        if key != 'linewidth':
-            if kwargs.get(key, None):
-                outline.pop(key, None)
     for obj in objs:
         if isinstance(obj, mpatches.FancyBboxPatch):
             obj.update(outline)  # the multiple-legend bounding box
@@ -4269,6 +4458,7 @@ property-spec, optional
     # legends in clunky way, e.g. entries denoting *colors* and entries denoting
     # *markers*. But would be better to add capacity for categorical labels in a
     # *single* legend like seaborn rather than multiple legends.
+    kw_setter = [('set_' + key, value) for key, value in kw_handle.items()]
     for obj in objs:
         try:
             children = obj._legend_handle_box._children
@@ -4277,10 +4467,13 @@ property-spec, optional
         for obj in _iter_legend_children(children):
             # Account for mixed legends, e.g. line on top of error bounds shading
             if isinstance(obj, mtext.Text):
-                obj.update(kw_text)
+                if kw_text:
+                    obj.update(kw_text)
             else:
-                for key, value in kw_handle.items():
-                    getattr(obj, f'set_{key}', lambda value: None)(value)
+                for name, value in kw_setter:
+                    setter = getattr(obj, name, None)
+                    if setter is not None:
+                        setter(value)
 
     # Append attributes and return, and set clip property!!! This is critical
     # for tight bounding box calcs!
@@ -4349,11 +4542,12 @@ def _process_wrapper(driver):
         if name not in proplot_methods:
             wrapper.__doc__ = None
 
-        # List wrapped methods in the driver function docstring
+        # Record wrapped methods for the driver function docstring
         # Prevents us from having to both explicitly apply decorators in
         # axes.py and explicitly list functions *again* in this file
-        docstring = driver._docstring_orig
-        if '{methods}' in docstring:
+        # NOTE: The docstrings are formatted once by _format_wrapper_docs after
+        # all axes classes are defined rather than every time a method is wrapped.
+        if '{methods}' in driver._docstring_orig:
             if name in proplot_methods:
                 link = f'`~proplot.axes.Axes.{name}`'
             else:
@@ -4361,17 +4555,29 @@ def _process_wrapper(driver):
             methods = driver._methods_wrapped
             if link not in methods:
                 methods.append(link)
-                string = (
-                    ', '.join(methods[:-1])
-                    + ',' * int(len(methods) > 2)  # Oxford comma bitches
-                    + ' and ' * int(len(methods) > 1)
-                    + methods[-1]
-                )
-                driver.__doc__ = docstring.format(methods=string)
         return wrapper
+    _WRAPPER_DRIVERS.append(driver)
     return decorator
 
 
+def _format_wrapper_docs():
+    """
+    Add the list of wrapped methods to the wrapper function docstrings. This is
+    called after the axes classes are defined.
+    """
+    for driver in _WRAPPER_DRIVERS:
+        methods = driver._methods_wrapped
+        if not methods:
+            continue
+        string = (
+            ', '.join(methods[:-1])
+            + ',' * int(len(methods) > 2)  # Oxford comma bitches
+            + ' and ' * int(len(methods) > 1)
+            + methods[-1]
+        )
+        driver.__doc__ = driver._docstring_orig.format(methods=string)
+
+
 # Generate function decorators and fill wrapper docstring. Each wrapper internally
 # calls function(self, ...) somewhere.
 _bar_wrapper = _process_wrapper(bar_wrapper)
@@ -6,11 +6,12 @@ New colormap classes and colormap normalization classes.
 # set(plot.colors._cmap_database) & set(plot.colors.mcolors._colors_full_map)
 # whenever new default colormaps are added. Currently result is
 # {'gray', 'marine', 'ocean', 'pink'} which correspond to MATLAB and GNUplot maps.
+import functools
 import json
 import os
 import re
+import sys
 from numbers import Integral, Number
-from xml.etree import ElementTree
 
 import matplotlib.cm as mcm
 import matplotlib.colors as mcolors
@@ -20,7 +21,7 @@ from matplotlib import rcParams
 
 from .internals import ic  # noqa: F401
 from .internals import _not_none, docstring, warnings
-from .utils import to_rgb, to_rgba, to_xyz, to_xyza
+from .utils import _to_rgb_array, _to_xyz_array, to_rgba, to_xyz, to_xyza
 
 if hasattr(mcm, '_cmap_registry'):
     _cmap_database_attr = '_cmap_registry'
@@ -61,6 +62,26 @@ CMAPS_DIVERGING = tuple(
         ('DryWet', 'WetDry')
     )
 )
+_CMAPS_MIRRORS = {
+    key: mirror for pair in CMAPS_DIVERGING
+    for key, mirror in (pair, pair[::-1])
+}
+
+# Channel indices and color string patterns used by _get_channel
+_CHANNEL_INDICES = {
+    'hue': 0,
+    'chroma': 1,
+    'saturation': 1,
+    'luminance': 2,
+}
+_CHANNEL_OFFSET = re.compile(r'([-+][0-9.]+)$')
+_CHANNEL_CYCLE = re.compile(r'\AC[0-9]')
+
+# Patterns used to read colormap files and parse colormap names
+_FILE_DELIM = re.compile(r'[,\s]+')
+_FILE_HEX = re.compile(HEX_PATTERN)
+_KEY_SUFFIX = re.compile(r'(_r(_s)?|_s)?\Z', re.IGNORECASE)
+_KEY_GRAYS = re.compile(r'\A(grays)(_r(_s)?|_s)?\Z')
 
 # Deprecations
 _cmaps_removed = {
@@ -180,24 +201,35 @@ def _get_channel(color, channel, space='hcl'):
     # Interpret channel
     if callable(color) or isinstance(color, Number):
         return color
-    if channel == 'hue':
-        channel = 0
-    elif channel in ('chroma', 'saturation'):
-        channel = 1
-    elif channel == 'luminance':
-        channel = 2
-    else:
+    if isinstance(color, str) and not _CHANNEL_CYCLE.match(color):
+        return _get_channel_cached(color, channel, space)
+    return _get_channel_value(color, channel, space)
+
+
+def _get_channel_value(color, channel, space):
+    """
+    Get the channel value from a color string or RGB tuple.
+    """
+    try:
+        channel = _CHANNEL_INDICES[channel]
+    except (KeyError, TypeError):
         raise ValueError(f'Unknown channel {channel!r}.')
     # Interpret string or RGB tuple
     offset = 0
     if isinstance(color, str):
-        match = re.search('([-+][0-9.]+)$', color)
+        match = _CHANNEL_OFFSET.search(color)
         if match:
             offset = float(match.group(0))
             color = color[:match.start()]
     return offset + to_xyz(color, space)[channel]
 
 
+# NOTE: The same color strings are resolved over and over when building colormaps
+# so cache them. The cache is cleared whenever the color database changes, and
+# cycle colors like 'C0' are never cached since they depend on the rc settings.
+_get_channel_cached = functools.lru_cache(maxsize=1024)(_get_channel_value)
+
+
 def _clip_colors(colors, clip=True, gray=0.2, warn=False):
     """
     Clip impossible colors rendered in an HSL-to-RGB colorspace conversion.
@@ -218,11 +250,12 @@ def _clip_colors(colors, clip=True, gray=0.2, warn=False):
         Whether to issue warning when colors are clipped.
     """
     colors = np.array(colors)
+    if clip and not warn:  # skip the masks
+        return np.clip(colors, 0, 1, out=colors)
     over = colors > 1
     under = colors < 0
     if clip:
-        colors[under] = 0
-        colors[over] = 1
+        np.clip(colors, 0, 1, out=colors)
     else:
         colors[under | over] = gray
     if warn:
@@ -235,6 +268,32 @@ def _clip_colors(colors, clip=True, gray=0.2, warn=False):
     return colors
 
 
+# NOTE: Colormaps are often re-initialized with identical lookup tables, e.g.
+# after set_cyclic() or when copied with the same segmentdata. Cache the result
+# keyed by the lookup table bytes. The arrays are read-only so they can be shared.
+@functools.lru_cache(maxsize=128)
+def _get_lut_rgb(lut, space, clip):
+    """
+    Return the clipped RGB translation of the bytes of an (N, 3) lookup table
+    in the input colorspace. Used by `PerceptuallyUniformColormap`.
+    """
+    rgb = _to_rgb_array(np.frombuffer(lut).reshape(-1, 3), space)
+    rgb = _clip_colors(rgb, clip)
+    rgb.flags.writeable = False
+    return rgb
+
+
+@functools.lru_cache(maxsize=32)
+def _get_lut_coords(N):
+    """
+    Return the read-only lookup table coordinates ``(N - 1) * np.linspace(0, 1, N)``.
+    Used by `make_mapping_array`.
+    """
+    xq = (N - 1) * np.linspace(0, 1, N)
+    xq.flags.writeable = False
+    return xq
+
+
 def _make_segmentdata_array(values, coords=None, ratios=None):
     """
     Return a segmentdata array or callable given the input colors
@@ -290,7 +349,7 @@ def _make_segmentdata_array(values, coords=None, ratios=None):
     return array
 
 
-def make_mapping_array(N, data, gamma=1.0, inverse=False):
+def make_mapping_array(N, data, gamma=1.0, inverse=False, xq=None):
     r"""
     Similar to `~matplotlib.colors.makeMappingArray` but permits
     *circular* hue gradations along 0-360, disables clipping of
@@ -339,6 +398,10 @@ def make_mapping_array(N, data, gamma=1.0, inverse=False):
         is done to weight low data values with higher luminance *and* lower
         saturation, thereby emphasizing "extreme" data values with stronger
         colors.
+    xq : ndarray, optional
+        The lookup table coordinates ``(N - 1) * np.linspace(0, 1, N)``. This
+        can be passed to avoid recomputing it when building several channels
+        with the same `N`.
     """
     # Allow for *callable* instead of linearly interpolating between segments
     gammas = np.atleast_1d(gamma)
@@ -377,43 +440,22 @@ def make_mapping_array(N, data, gamma=1.0, inverse=False):
         raise ValueError(
             'Data mapping points must have x in increasing order.'
         )
+    # Constant channels e.g. from make_segmentdata_array with a single value
+    if (y0 == y1[0]).all() and (y1 == y1[0]).all():
+        return np.full(N, y1[0], dtype=float)
     x = x * (N - 1)
 
     # Get distances from the segmentdata entry to the *left* for each requested
     # level, excluding ends at (0,1), which must exactly match segmentdata ends
-    xq = (N - 1) * np.linspace(0, 1, N)
-    # where xq[i] must be inserted so it is larger than x[ind[i]-1] but
-    # smaller than x[ind[i]]
-    ind = np.searchsorted(x, xq)[1:-1]
-    distance = (xq[1:-1] - x[ind - 1]) / (x[ind] - x[ind - 1])
-
-    # Scale distances in each segment by input gamma
-    # The ui are starting-points, the ci are counts from that point
-    # over which segment applies (i.e. where to apply the gamma), the relevant
-    # 'segment' is to the *left* of index returned by searchsorted
-    _, uind, cind = np.unique(ind, return_index=True, return_counts=True)
-    for ui, ci in zip(uind, cind):  # length should be N-1
-        # the relevant segment is to *left* of this number
-        gamma = gammas[ind[ui] - 1]
-        if gamma == 1:
-            continue
-        ireverse = False
-        if ci > 1:  # i.e. more than 1 color in this 'segment'
-            # by default want to weight toward a *lower* channel value
-            ireverse = ((y0[ind[ui]] - y1[ind[ui] - 1]) < 0)
-        if inverse:
-            ireverse = not ireverse
-        if ireverse:
-            distance[ui:ui + ci] = 1 - (1 - distance[ui:ui + ci])**gamma
-        else:
-            distance[ui:ui + ci] **= gamma
+    if xq is None:
+        xq = _get_lut_coords(N)
+    # Simple linear interpolation if there are no gammas or discontinuities
+    if (gammas == 1).all() and (y0 == y1).all() and (np.diff(x) > 0).all():
+        return np.interp(xq, x, y1)
 
-    # Perform successive linear interpolations all rolled up into one equation
-    lut = np.zeros((N,), float)
-    lut[1:-1] = distance * (y0[ind] - y1[ind - 1]) + y1[ind - 1]
-    lut[0] = y1[0]
-    lut[-1] = y0[-1]
-    return lut
+    # Scale by gamma and interpolate, using numba if it is installed
+    from .internals import accel
+    return accel.mapping_array(xq, x, y0, y1, gammas, inverse)
 
 
 class _Colormap(object):
@@ -437,11 +479,13 @@ class _Colormap(object):
         colors = self._lut[:-3, :]
 
         # Get data string
+        # NOTE: Format the lookup table rows directly rather than passing each
+        # color through to_hex or to_rgb.
         if ext == 'hex':
-            data = ', '.join(mcolors.to_hex(color) for color in colors)
+            data = np.round(colors[:, :3] * 255).astype(int)
+            data = ', '.join('#{:02x}{:02x}{:02x}'.format(*rgb) for rgb in data)
         elif ext in ('txt', 'rgb'):
-            rgb = mcolors.to_rgba if alpha else mcolors.to_rgb
-            data = [rgb(color) for color in colors]
+            data = colors if alpha else colors[:, :3]
             data = '\n'.join(
                 ' '.join(f'{num:0.6f}' for num in line) for line in data
             )
@@ -525,21 +569,21 @@ class _Colormap(object):
             # Load
             # NOTE: This appears to be biggest import time bottleneck! Increases
             # time from 0.05s to 0.2s, with numpy loadtxt or with this regex thing.
-            delim = re.compile(r'[,\s]+')
-            data = [
-                delim.split(line.strip())
-                for line in open(filename)
-                if line.strip() and line.strip()[0] != '#'
-            ]
+            # Split the whole table at once and let numpy convert the strings
+            # rather than splitting and converting each line in python.
+            with open(filename) as fh:
+                lines = [line.strip() for line in fh]
+            lines = [line for line in lines if line and line[0] != '#']
             try:
-                data = [[float(num) for num in line] for line in data]
-            except ValueError:
+                ncols = len(_FILE_DELIM.split(lines[0]))
+                data = np.array(_FILE_DELIM.split(' '.join(lines)), dtype=float)
+                data = data.reshape(-1, ncols)
+            except (IndexError, ValueError):
                 return _warn_or_raise(
                     f'Failed to load {filename!r}. Expected a table of comma '
                     'or space-separated values.'
                 )
             # Build x-coordinates and standardize shape
-            data = np.array(data)
             if data.shape[1] not in (3, 4):
                 return _warn_or_raise(
                     f'Failed to load {filename!r}. Got {data.shape[1]} columns, '
@@ -554,29 +598,36 @@ class _Colormap(object):
         # Adapted from script found here:
         # https://sciviscolor.org/matlab-matplotlib-pv44/
         elif ext == 'xml':
+            from xml.etree import ElementTree  # only needed for xml files
+            # NOTE: Stream the <Point> tags with iterparse and clear each one
+            # rather than building the full tree and searching it.
+            x, data = [], []
             try:
-                doc = ElementTree.parse(filename)
+                with open(filename, 'rb') as fh:
+                    for _, s in ElementTree.iterparse(fh):
+                        if s.tag != 'Point':
+                            continue
+                        # Verify keys
+                        attrib = s.attrib
+                        if any(key not in attrib for key in 'xrgb'):
+                            return _warn_or_raise(
+                                f'Failed to load {filename!r}. Missing an x, r, g, '
+                                'or b specification inside one or more <Point> tags.'
+                            )
+                        # Get data
+                        color = [
+                            float(attrib[key])
+                            for key in 'rgbao'  # o for opacity
+                            if key in attrib
+                        ]
+                        x.append(float(attrib['x']))
+                        data.append(color)
+                        s.clear()
             except ElementTree.ParseError:
                 return _warn_or_raise(
                     f'Failed to load {filename!r}. Parsing error.',
                     ElementTree.ParseError
                 )
-            x, data = [], []
-            for s in doc.getroot().findall('.//Point'):
-                # Verify keys
-                if any(key not in s.attrib for key in 'xrgb'):
-                    return _warn_or_raise(
-                        f'Failed to load {filename!r}. Missing an x, r, g, or b '
-                        'specification inside one or more <Point> tags.'
-                    )
-                # Get data
-                color = []
-                for key in 'rgbao':  # o for opacity
-                    if key not in s.attrib:
-                        continue
-                    color.append(float(s.attrib[key]))
-                x.append(float(s.attrib['x']))
-                data.append(color)
             # Convert to array
             if not all(
                 len(data[0]) == len(color) and len(color) in (3, 4)
@@ -591,14 +642,17 @@ class _Colormap(object):
         elif ext == 'hex':
             # Read arbitrary format
             string = open(filename).read()  # into single string
-            data = re.findall(HEX_PATTERN, string)
+            data = _FILE_HEX.findall(string)
             if len(data) < 2:
                 return _warn_or_raise(
                     f'Failed to load {filename!r}. Hex strings not found.'
                 )
             # Convert to array
+            # NOTE: Unpack the channels with bit shifts rather than parsing each
+            # string with to_rgb. Any alpha digits are ignored as before.
             x = np.linspace(0, 1, len(data))
-            data = [to_rgb(color) for color in data]
+            data = np.array([int(color[1:7], 16) for color in data])
+            data = np.stack((data >> 16, (data >> 8) & 255, data & 255), axis=1) / 255
 
         # Invalid extension
         else:
@@ -620,8 +674,13 @@ class _Colormap(object):
         if listed:
             return ListedColormap(data, name)
         else:
-            data = [(x, color) for x, color in zip(x, data)]
-            return LinearSegmentedColormap.from_list(name, data)
+            # NOTE: Build the segment data from the channel columns directly
+            # rather than converting each color individually with from_list.
+            keys = ('red', 'green', 'blue', 'alpha')
+            cdict = {'alpha': np.column_stack((x[[0, -1]], np.ones((2, 2))))}
+            for key, values in zip(keys, data.T):
+                cdict[key] = np.column_stack((x, values, values))
+            return LinearSegmentedColormap(name, cdict)
 
 
 class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
@@ -728,37 +787,55 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         ratios = np.asarray(ratios) / np.sum(ratios)
         x0 = np.append(0, np.cumsum(ratios))  # coordinates for edges
         xw = x0[1:] - x0[:-1]  # widths between edges
-        for key in cmaps[0]._segmentdata.keys():  # not self._segmentdata
+        # NOTE: Look up each segment array once per colormap rather than probing
+        # the segmentdata dictionaries repeatedly inside the loop below.
+        keys = cmaps[0]._segmentdata.keys()  # not self._segmentdata
+        segments = {
+            key: [
+                data if callable(data) else np.asarray(data)
+                for data in (cmap._segmentdata[key] for cmap in cmaps)
+            ]
+            for key in keys
+        }
+        for key in keys:
             # Callable segments
             # WARNING: If just reference a global 'funcs' list from inside the
             # 'data' function it can get overwritten in this loop. Must
             # embed 'funcs' into the definition using a keyword argument.
-            callable_ = [callable(cmap._segmentdata[key]) for cmap in cmaps]
+            datas = segments[key]
+            callable_ = [callable(data) for data in datas]
             if all(callable_):  # expand range from x-to-w to 0-1
-                funcs = [cmap._segmentdata[key] for cmap in cmaps]
+                funcs = datas
 
-                def xyy(ix, funcs=funcs):
+                def xyy(ix, funcs=funcs, x0=x0, xw=xw):
                     ix = np.atleast_1d(ix)
+                    idx = np.searchsorted(x0, ix) - 1
+                    idx = np.clip(idx, 0, len(funcs) - 1)
                     kx = np.empty(ix.shape)
-                    for j, jx in enumerate(ix.flat):
-                        idx = max(np.searchsorted(x0, jx) - 1, 0)
-                        kx.flat[j] = funcs[idx]((jx - x0[idx]) / xw[idx])
+                    for j, func in enumerate(funcs):  # call once per colormap
+                        mask = idx == j
+                        if mask.any():
+                            kx[mask] = func((ix[mask] - x0[j]) / xw[j])
                     return kx
 
             # Concatenate segment arrays and make the transition at the
             # seam instant so we *never interpolate* between end colors
             # of different maps.
+            # NOTE: Write each segment array into a single preallocated array
+            # rather than copying the arrays and concatenating them.
             elif not any(callable_):
-                datas = []
-                for x, w, cmap in zip(x0[:-1], xw, cmaps):
-                    xyy = np.array(cmap._segmentdata[key])
-                    xyy[:, 0] = x + w * xyy[:, 0]
-                    datas.append(xyy)
-                for i in range(len(datas) - 1):
-                    datas[i][-1, 2] = datas[i + 1][0, 2]
-                    datas[i + 1] = datas[i + 1][1:, :]
-                xyy = np.concatenate(datas, axis=0)
-                xyy[:, 0] = xyy[:, 0] / xyy[:, 0].max(axis=0)  # fix fp errors
+                xyy = np.empty((sum(map(len, datas)) - len(datas) + 1, 3))
+                j = 0
+                for i, (x, w, data) in enumerate(zip(x0[:-1], xw, datas)):
+                    if i > 0:  # drop the first row and use its y1 for the seam
+                        xyy[j - 1, 2] = data[0, 2]
+                        data = data[1:, :]
+                    n = len(data)
+                    np.multiply(data[:, 0], w, out=xyy[j:j + n, 0])
+                    xyy[j:j + n, 0] += x
+                    xyy[j:j + n, 1:] = data[:, 1:]
+                    j += n
+                xyy[:, 0] /= xyy[:, 0].max(axis=0)  # fix fp errors
 
             else:
                 raise TypeError(
@@ -777,13 +854,13 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
                 continue
             gamma = []
 
-            for cmap in cmaps:
+            for cmap, data in zip(cmaps, datas):
                 igamma = getattr(cmap, '_' + ikey)
                 if not np.iterable(igamma):
                     if all(callable_):
                         igamma = [igamma]
                     else:
-                        igamma = (len(cmap._segmentdata[key]) - 1) * [igamma]
+                        igamma = (len(data) - 1) * [igamma]
                 gamma.extend(igamma)
 
             if all(callable_):
@@ -892,10 +969,13 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             def func_r(x):
                 return dat(1.0 - x)
             return func_r
+
+        def reverse(dat):
+            xyy = np.array(dat, dtype=float)[::-1, [0, 2, 1]]  # swap y0 and y1
+            xyy[:, 0] = 1.0 - xyy[:, 0]
+            return xyy
         segmentdata = {
-            key:
-            factory(data) if callable(data) else
-            [(1.0 - x, y1, y0) for x, y0, y1 in reversed(data)]
+            key: factory(data) if callable(data) else reverse(data)
             for key, data in self._segmentdata.items()
         }
         for key in ('gamma1', 'gamma2'):
@@ -946,11 +1026,11 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             # this brute force workaround.
             data = {}
             for key, value in self._segmentdata.items():
-                if callable(value):
+                if callable(value):  # sample all points at once like matplotlib
                     x = np.linspace(0, 1, 256)  # just save the transitions
-                    y = np.array([value(_) for _ in x]).squeeze()
-                    value = np.vstack((x, y, y)).T
-                data[key] = np.asarray(value).astype(float).tolist()
+                    y = np.broadcast_to(np.asarray(value(x), dtype=float), x.shape)
+                    value = np.column_stack((x, y, y))
+                data[key] = np.asarray(value, dtype=float).tolist()
             # Add critical attributes to the dictionary
             keys = ()
             if isinstance(self, PerceptuallyUniformColormap):
@@ -1086,15 +1166,19 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
                 x = xyy[:, 0]
                 l = np.searchsorted(x, left)  # first x value > left  # noqa
                 r = np.searchsorted(x, right) - 1  # last x value < right
-                xc = xyy[l:r + 1, :].copy()
                 xl = xyy[l - 1, 1:] + (left - x[l - 1]) * (
                     (xyy[l, 1:] - xyy[l - 1, 1:]) / (x[l] - x[l - 1])
                 )
                 xr = xyy[r, 1:] + (right - x[r]) * (
                     (xyy[r + 1, 1:] - xyy[r, 1:]) / (x[r + 1] - x[r])
                 )
-                xyy = np.vstack(((left, *xl), xc, (right, *xr)))
-                xyy[:, 0] = (xyy[:, 0] - left) / (right - left)
+                xyy_new = np.empty((r - l + 3, xyy.shape[1]))  # fill in place
+                xyy_new[0, 0], xyy_new[0, 1:] = left, xl
+                xyy_new[1:-1, :] = xyy[l:r + 1, :]
+                xyy_new[-1, 0], xyy_new[-1, 1:] = right, xr
+                xyy_new[:, 0] -= left
+                xyy_new[:, 0] /= right - left
+                xyy = xyy_new
             segmentdata[key] = xyy
             # Retain the corresponding gamma *segments*
             if key == 'saturation':
@@ -1281,10 +1365,14 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         return f'ListedColormap(name={self.name!r})'
 
     def __repr__(self):
+        # NOTE: Convert the colors in one to_rgba_array call and format the rounded
+        # channels directly rather than calling to_hex on each color.
+        colors = np.round(mcolors.to_rgba_array(self.colors)[:, :3] * 255)
+        colors = ['#{:02x}{:02x}{:02x}'.format(*rgb) for rgb in colors.astype(int)]
         return (
             'ListedColormap({\n'
             f" 'name': {self.name!r},\n"
-            f" 'colors': {[mcolors.to_hex(color) for color in self.colors]},\n"
+            f" 'colors': {colors},\n"
             '})'
         )
 
@@ -1380,9 +1468,9 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         alpha : float
             The opacity.
         """
-        colors = [list(mcolors.to_rgba(color)) for color in self.colors]
-        for color in colors:
-            color[3] = alpha
+        # NOTE: Copy because some matplotlib versions return float arrays as-is
+        colors = np.array(mcolors.to_rgba_array(self.colors))
+        colors[:, 3] = alpha
         self.colors = colors
         self._init()
 
@@ -1403,8 +1491,12 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         if name is None:
             name = self.name + '_s'
         shift = shift % len(self.colors)
-        colors = list(self.colors)
-        colors = colors[shift:] + colors[:shift]
+        colors = self.colors
+        if isinstance(colors, np.ndarray):  # avoid converting rows to a list
+            colors = np.concatenate((colors[shift:], colors[:shift]))
+        else:
+            colors = list(colors)
+            colors = colors[shift:] + colors[:shift]
         return self.copy(colors, name, len(colors))
 
     def truncate(self, left=None, right=None, name=None):
@@ -1533,7 +1625,9 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         >>> cmap = plot.PerceptuallyUniformColormap(data)
         """
         # Checks
-        space = _not_none(space, 'hsl').lower()
+        # NOTE: Intern the lowercase name so the cached color conversion lookups
+        # keyed by the colorspace can compare it by identity.
+        space = sys.intern(_not_none(space, 'hsl').lower())
         if space not in ('rgb', 'hsv', 'hpl', 'hsl', 'hcl'):
             raise ValueError(f'Unknown colorspace {space!r}.')
         keys = {*segmentdata.keys()}
@@ -1543,14 +1637,19 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
                 f'Invalid segmentdata dictionary with keys {keys!r}.'
             )
         # Convert color strings to channel values
+        # NOTE: Build new arrays instead of modifying the input lists in-place
+        # and skip the channel lookup for numbers.
+        segmentdata = dict(segmentdata)
         for key, array in segmentdata.items():
             if callable(array):  # permit callable
                 continue
-            for i, xyy in enumerate(array):
-                xyy = list(xyy)  # make copy!
-                for j, y in enumerate(xyy[1:]):  # modify the y values
-                    xyy[j + 1] = _get_channel(y, key, space)
-                segmentdata[key][i] = xyy
+            segmentdata[key] = np.array([
+                [xyy[0], *(
+                    y if isinstance(y, Number) else _get_channel(y, key, space)
+                    for y in xyy[1:]
+                )]
+                for xyy in array
+            ], dtype=float)
         # Initialize
         super().__init__(name, segmentdata, gamma=1.0, N=N, **kwargs)
         # Custom properties
@@ -1569,15 +1668,16 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         inverses = (False, False, True)  # weight low chroma, high luminance
         gammas = (1.0, self._gamma1, self._gamma2)
         self._lut_hsl = np.ones((self.N + 3, 4), float)  # fill
+        xq = _get_lut_coords(self.N)  # shared by each channel
         for i, (channel, gamma, inverse) in enumerate(
             zip(channels, gammas, inverses)
         ):
             self._lut_hsl[:-3, i] = make_mapping_array(
-                self.N, self._segmentdata[channel], gamma, inverse
+                self.N, self._segmentdata[channel], gamma, inverse, xq=xq
             )
         if 'alpha' in self._segmentdata:
             self._lut_hsl[:-3, 3] = make_mapping_array(
-                self.N, self._segmentdata['alpha']
+                self.N, self._segmentdata['alpha'], xq=xq
             )
         self._lut_hsl[:-3, 0] %= 360
 
@@ -1587,9 +1687,8 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         self._isinit = True
 
         # Now convert values to RGB and clip colors
-        for i in range(self.N + 3):
-            self._lut[i, :3] = to_rgb(self._lut[i, :3], self._space)
-        self._lut[:, :3] = _clip_colors(self._lut[:, :3], self._clip)
+        lut = np.ascontiguousarray(self._lut[:, :3]).tobytes()
+        self._lut[:, :3] = _get_lut_rgb(lut, self._space, self._clip)
 
     @docstring.add_snippets
     def set_gamma(self, gamma=None, gamma1=None, gamma2=None):
@@ -1600,12 +1699,16 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         ----------
         %(cmap.gamma)s
         """
-        gamma1 = _not_none(gamma1, gamma)
-        gamma2 = _not_none(gamma2, gamma)
-        if gamma1 is not None:
-            self._gamma1 = gamma1
-        if gamma2 is not None:
-            self._gamma2 = gamma2
+        gamma1 = _not_none(gamma1, gamma, self._gamma1)
+        gamma2 = _not_none(gamma2, gamma, self._gamma2)
+        if (
+            self._isinit
+            and np.array_equal(gamma1, self._gamma1)
+            and np.array_equal(gamma2, self._gamma2)
+        ):
+            return  # lookup table is unchanged
+        self._gamma1 = gamma1
+        self._gamma2 = gamma2
         self._init()
 
     def copy(
@@ -1825,12 +1928,13 @@ optional
             and not isinstance(colors[0], str)
         ):
             coords, colors = zip(*colors)
-        colors = [to_xyza(color, space) for color in colors]
+        colors = np.array([to_rgba(color) for color in colors])
+        colors[:, :3] = _to_xyz_array(colors[:, :3], space)
 
         # Build segmentdata
         keys = ('hue', 'saturation', 'luminance', 'alpha')
         cdict = {}
-        for key, values in zip(keys, zip(*colors)):
+        for key, values in zip(keys, colors.T):
             cdict[key] = _make_segmentdata_array(values, coords, ratios)
         return cls(name, cdict, **kwargs)
 
@@ -1847,10 +1951,11 @@ def _check_levels(levels, allow_descending=True):
         levels = levels.filled(np.nan)
     if not np.all(np.isfinite(levels)):
         raise ValueError(f'Levels {levels} contain invalid values.')
-    diffs = np.sign(np.diff(levels))
-    if all(diffs == 1):
+    # NOTE: Compare neighbors with numpy reductions rather than iterating over
+    # an array of signs with the builtin all().
+    if np.all(levels[1:] > levels[:-1]):
         descending = False
-    elif all(diffs == -1) and allow_descending:
+    elif allow_descending and np.all(levels[1:] < levels[:-1]):
         levels = levels[::-1]
         descending = True
     elif allow_descending:
@@ -1872,25 +1977,40 @@ def _interpolate_extrapolate(xq, x, y):
     Efficient vectorized linear interpolation. Similar to `numpy.interp`
     except this does not truncate out-of-bounds values (i.e. is reversible).
     """
-    # Follow example of make_mapping_array for efficient, vectorized
-    # linear interpolation across multiple segments.
-    # * Normal test puts values at a[i] if a[i-1] < v <= a[i]; for
-    #   left-most data, satisfy a[0] <= v <= a[1]
-    # * searchsorted gives where xq[i] must be inserted so it is larger
-    #   than x[ind[i]-1] but smaller than x[ind[i]]
-    # yq = ma.masked_array(np.interp(xq, x, y), mask=ma.getmask(xq))
-    x = np.asarray(x)
-    y = np.asarray(y)
-    xq = np.atleast_1d(xq)
-    idx = np.searchsorted(x, xq)
-    idx[idx == 0] = 1  # get normed value <0
-    idx[idx == len(x)] = len(x) - 1  # get normed value >0
-    distance = (xq - x[idx - 1]) / (x[idx] - x[idx - 1])
-    yq = distance * (y[idx] - y[idx - 1]) + y[idx - 1]
-    yq = ma.masked_array(yq, mask=ma.getmask(xq))
+    # NOTE: Use numpy.interp for in-bounds values, then linearly extrapolate
+    # out-of-bounds values from the end segments instead of truncating them.
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if not getattr(xq, 'ndim', 0):  # normalizers pass 1D or higher arrays
+        xq = np.atleast_1d(xq)
+    data = ma.getdata(xq)
+    yq = np.interp(data, x, y)
+    for mask, i, j in ((data < x[0], 0, 1), (data > x[-1], -2, -1)):
+        if mask.any():
+            yq[mask] = y[i] + (data[mask] - x[i]) * (y[j] - y[i]) / (x[j] - x[i])
+    # NOTE: Mask NaN and infinite results like masked array arithmetic would
+    yq = ma.masked_array(yq, mask=ma.getmaskarray(xq) | ~np.isfinite(yq))
     return yq
 
 
+def _searchsorted_uniform(x, step, xq):
+    """
+    Equivalent to ``np.searchsorted(x, xq)`` for evenly spaced `x` with spacing
+    `step`, but computes the indices with arithmetic instead of a binary search.
+    """
+    n = x.size
+    idx = np.subtract(xq, x[0], dtype=float)
+    idx /= step
+    np.ceil(idx, out=idx)
+    np.fmin(idx, n, out=idx)  # also sends NaN to the end like searchsorted
+    np.maximum(idx, 0, out=idx)
+    idx = idx.astype(np.intp)
+    # Correct off-by-one errors from floating point roundoff near the bin edges
+    idx[(idx < n) & (xq > x[np.minimum(idx, n - 1)])] += 1
+    idx[(idx > 0) & (xq <= x[np.maximum(idx - 1, 0)])] -= 1
+    return idx
+
+
 class DiscreteNorm(mcolors.BoundaryNorm):
     """
     Meta-normalizer that discretizes the possible color values returned by
@@ -2011,8 +2131,8 @@ class DiscreteNorm(mcolors.BoundaryNorm):
         self.N = levels.size
         self.clip = clip
         self.boundaries = levels
-        self.vmin = norm.vmin = vmin = np.min(levels)
-        self.vmax = norm.vmax = vmax = np.max(levels)
+        self.vmin = norm.vmin = vmin = levels[0]  # levels are increasing
+        self.vmax = norm.vmax = vmax = levels[-1]
         vcenter = getattr(norm, 'vcenter', None)
 
         # Get color coordinates corresponding to each bin, plus extra
@@ -2043,12 +2163,15 @@ class DiscreteNorm(mcolors.BoundaryNorm):
                 mids, np.min(mids), np.max(mids), vmin, vmax
             )
         else:
-            mids = mids.copy()
-            mids[mids < vcenter] = _interpolate_basic(
-                mids[mids < vcenter], np.min(mids), vcenter, vmin, vcenter,
+            # NOTE: Compute each mask once and modify the new mids array in-place.
+            # The upper mask must be computed after the lower values are scaled.
+            mask = mids < vcenter
+            mids[mask] = _interpolate_basic(
+                mids[mask], np.min(mids), vcenter, vmin, vcenter,
             )
-            mids[mids >= vcenter] = _interpolate_basic(
-                mids[mids >= vcenter], vcenter, np.max(mids), vcenter, vmax,
+            mask = mids >= vcenter
+            mids[mask] = _interpolate_basic(
+                mids[mask], vcenter, np.max(mids), vcenter, vmax,
             )
         eps = 1e-10  # mids and dest are numpy.float64
         dest = norm(mids)
@@ -2066,8 +2189,16 @@ class DiscreteNorm(mcolors.BoundaryNorm):
         # end up with unpredictable fill value, weird "out-of-bounds" colors
         self._bmin = np.min(mids)
         self._bmax = np.max(mids)
-        self._bins = bins
+        # NOTE: The default linear normalizer preserves the order of data values,
+        # so the data can be binned against the levels directly. This skips the
+        # normalizer call on every draw.
+        self._linear = type(norm) is mcolors.Normalize and not norm.clip
+        self._bins = levels if self._linear else bins
         self._dest = dest
+        self._step = None
+        steps = np.diff(self._bins)  # evenly spaced bins are binned with arithmetic
+        if np.allclose(steps, steps[0], rtol=1e-6, atol=0):
+            self._step = steps[0]
         self._norm = norm
         self._norm_clip = None
         self._descending = descending
@@ -2087,7 +2218,8 @@ class DiscreteNorm(mcolors.BoundaryNorm):
             Default is ``self.clip``.
         """
         # Follow example of LinearSegmentedNorm, but perform no interpolation,
-        # just use searchsorted to bin the data.
+        # just use searchsorted to bin the data. Evenly spaced bins, e.g. from
+        # MaxNLocator, are binned with arithmetic rather than a binary search.
         norm_clip = self._norm_clip
         if norm_clip:  # special extra clipping due to normalizer
             value = np.clip(value, *norm_clip)
@@ -2096,11 +2228,17 @@ class DiscreteNorm(mcolors.BoundaryNorm):
         if clip:  # note that np.clip can handle masked arrays
             value = np.clip(value, self._bmin, self._bmax)
         xq, is_scalar = self.process_value(value)
-        xq = self._norm(xq)
-        yq = self._dest[np.searchsorted(self._bins, xq)]
+        if not self._linear:
+            xq = self._norm(xq)
+        if self._step is None:
+            from .internals import accel
+            yq = accel.discretize(ma.getdata(xq), self._bins, self._dest)
+        else:
+            idx = _searchsorted_uniform(self._bins, self._step, ma.getdata(xq))
+            yq = self._dest[idx]
         yq = ma.array(yq, mask=ma.getmask(xq))
         if is_scalar:
-            yq = np.atleast_1d(yq)[0]
+            yq = yq[0]
         return yq
 
     def inverse(self, value):  # noqa: U100
@@ -2174,7 +2312,7 @@ class LinearSegmentedNorm(mcolors.Normalize):
         xq, is_scalar = self.process_value(value)
         yq = _interpolate_extrapolate(xq, self._x, self._y)
         if is_scalar:
-            yq = np.atleast_1d(yq)[0]
+            yq = yq[0]
         return yq
 
     def inverse(self, value):
@@ -2189,7 +2327,7 @@ class LinearSegmentedNorm(mcolors.Normalize):
         yq, is_scalar = self.process_value(value)
         xq = _interpolate_extrapolate(yq, self._y, self._x)
         if is_scalar:
-            xq = np.atleast_1d(xq)[0]
+            xq = xq[0]
         return xq
 
 
@@ -2251,30 +2389,30 @@ class DivergingNorm(mcolors.Normalize):
             clip = self.clip
         if clip:  # note that np.clip can handle masked arrays
             value = np.clip(value, self.vmin, self.vmax)
-        if self.vmin > self.vmax:
+        # NOTE: The scaling is at most two straight lines joined at vcenter, so
+        # evaluate them directly rather than with _interpolate_extrapolate.
+        vmin, vmax, vcenter = self.vmin, self.vmax, self.vcenter
+        x = ma.getdata(xq)
+        if vmin > vmax:
             raise ValueError('vmin must be less than or equal to vmax.')
-        elif self.vmin == self.vmax:
-            x = [self.vmin, self.vmax]
-            y = [0.0, 0.0]
-        elif self.vcenter >= self.vmax:
-            x = [self.vmin, self.vcenter]
-            y = [0.0, 0.5]
-        elif self.vcenter <= self.vmin:
-            x = [self.vcenter, self.vmax]
-            y = [0.5, 1.0]
+        elif vmin == vmax:
+            yq = 0.0 * x  # preserve non-finite values so they are masked below
+        elif vcenter >= vmax:
+            yq = 0.5 * (x - vmin) / (vcenter - vmin)
+        elif vcenter <= vmin:
+            yq = 0.5 + 0.5 * (x - vcenter) / (vmax - vcenter)
         elif not self.fair:
-            x = [self.vmin, self.vcenter, self.vmax]
-            y = [0, 0.5, 1.0]
-        else:
-            offset = max(
-                np.abs(self.vcenter - self.vmin),
-                np.abs(self.vmax - self.vcenter),
+            yq = np.where(
+                x < vcenter,
+                0.5 * (x - vmin) / (vcenter - vmin),
+                0.5 + 0.5 * (x - vcenter) / (vmax - vcenter),
             )
-            x = [self.vcenter - offset, self.vcenter + offset]
-            y = [0, 1.0]
-        yq = _interpolate_extrapolate(xq, x, y)
+        else:
+            offset = max(np.abs(vcenter - vmin), np.abs(vmax - vcenter))
+            yq = 0.5 + 0.5 * (x - vcenter) / offset
+        yq = ma.masked_array(yq, mask=ma.getmaskarray(xq) | ~np.isfinite(yq))
         if is_scalar:
-            yq = np.atleast_1d(yq)[0]
+            yq = yq[0]
         return yq
 
     def autoscale_None(self, z):
@@ -2339,6 +2477,11 @@ class ColorDatabase(dict):
 
 
 class _ColorCache(dict):
+    def clear(self):
+        # Also clear the cached colormap channel values for color strings
+        super().clear()
+        _get_channel_cached.cache_clear()
+
     def __getitem__(self, key):
         # Matplotlib 'color' args are passed to to_rgba, which tries to read
         # directly from cache and if that fails, sanitizes input, which
@@ -2422,22 +2565,27 @@ class ColormapDatabase(dict):
     colormap registry. See `~ColormapDatabase.__getitem__` and
     `~ColormapDatabase.__setitem__` for details.
     """
+    __slots__ = ()
+
     def __init__(self, kwargs):
         """
         Parameters
         ----------
         kwargs : dict-like
-            The source dictionary.
+            The source dictionary. Reversed and shifted colormaps ending in
+            ``'_r'`` or ``'_s'`` are skipped since they are generated on the fly.
         """
         for key, value in kwargs.items():
+            if isinstance(key, str) and key.endswith(('_r', '_s')):
+                continue
             self.__setitem__(key, value)
 
     def __delitem__(self, key):
         """
         Delete the item from the database.
         """
-        key = self._sanitize_key(key, mirror=True)
-        super().__delitem__(key)
+        key, reverse = self._sanitize_key(key, mirror=True)
+        super().__delitem__(key + '_r' if reverse else key)
 
     def __getitem__(self, key):
         """
@@ -2451,35 +2599,8 @@ class ColormapDatabase(dict):
         * Reversed diverging colormaps can be requested with their "reversed"
           name -- for example, ``'BuRd'`` is equivalent to ``'RdBu_r'``.
         """
-        # Deprecate previous names with support for '_r' and '_s' suffixes
-        # NOTE: Must search only for case sensitive *capitalized* names or we would
-        # helpfully "redirect" user to correct cmap when they are trying to generate
-        # a monochromatic cmap in Colormap and would disallow some color names.
-        test = re.sub(r'(_r(_s)?|_s)?\Z', '', key, flags=re.IGNORECASE)
-        if not super().__contains__(test):
-            if test in _cmaps_removed:
-                version = _cmaps_removed[test]
-                raise ValueError(
-                    f'ProPlot colormap {key!r} was removed in version {version}.'
-                )
-            if test in _cmaps_renamed:
-                test_new, version = _cmaps_renamed[test]
-                warnings._warn_proplot(
-                    f'Colormap {test!r} was renamed in version {version} and will be '
-                    f'deprecated in a future release. Please use {test_new!r} instead.'
-                )
-                key = re.sub(test, test_new, key, flags=re.IGNORECASE)
-
-        # Sanitize key and handle suffixes
-        key = self._sanitize_key(key, mirror=True)
-        shift = key[-2:] == '_s'
-        if shift:
-            key = key[:-2]
-        reverse = key[-2:] == '_r'
-        if reverse:
-            key = key[:-2]
-
         # Get item and issue nice error message
+        key, reverse, shift = self._parse_key(key)
         try:
             value = super().__getitem__(key)  # may raise keyerror
         except KeyError:
@@ -2516,46 +2637,80 @@ class ColormapDatabase(dict):
         """
         if not isinstance(key, str):
             raise KeyError(f'Invalid key {key!r}. Must be string.')
-        key = self._sanitize_key(key, mirror=False)
+        key, reverse = self._sanitize_key(key, mirror=False)
         item = _to_proplot_colormap(item)
-        super().__setitem__(key, item)
+        super().__setitem__(key + '_r' if reverse else key, item)
 
     def __contains__(self, item):
         """
         Test for membership using the sanitized colormap name.
         """
-        try:  # by default __contains__ ignores __getitem__ overrides
-            self.__getitem__(item)
-            return True
+        # NOTE: By default __contains__ ignores __getitem__ overrides. Parse the key
+        # manually rather than calling __getitem__ so that testing membership does
+        # not have to generate reversed or shifted colormaps.
+        try:
+            key, reverse, shift = self._parse_key(item)
+            value = super().__getitem__(key)
         except KeyError:
             return False
+        return (
+            (not reverse or hasattr(value, 'reversed'))
+            and (not shift or hasattr(value, 'shifted'))
+        )
+
+    def _parse_key(self, key):
+        """
+        Return the sanitized colormap name without suffixes, and whether the
+        colormap should be reversed and shifted.
+        """
+        # Deprecate previous names with support for '_r' and '_s' suffixes
+        # NOTE: Must search only for case sensitive *capitalized* names or we would
+        # helpfully "redirect" user to correct cmap when they are trying to generate
+        # a monochromatic cmap in Colormap and would disallow some color names.
+        if not isinstance(key, str):
+            raise KeyError(f'Invalid key {key!r}. Key must be a string.')
+        test = _KEY_SUFFIX.sub('', key)
+        if not super().__contains__(test):
+            if test in _cmaps_removed:
+                version = _cmaps_removed[test]
+                raise ValueError(
+                    f'ProPlot colormap {key!r} was removed in version {version}.'
+                )
+            if test in _cmaps_renamed:
+                test_new, version = _cmaps_renamed[test]
+                warnings._warn_proplot(
+                    f'Colormap {test!r} was renamed in version {version} and will be '
+                    f'deprecated in a future release. Please use {test_new!r} instead.'
+                )
+                key = re.sub(test, test_new, key, flags=re.IGNORECASE)
+
+        # Sanitize key and handle suffixes
+        key = key.lower()
+        shift = key.endswith('_s')
+        if shift:
+            key = key[:-2]
+        key, reverse = self._sanitize_key(key, mirror=True)
+        return key, reverse, shift
 
     def _sanitize_key(self, key, mirror=True):
         """
-        Return the sanitized colormap name. This is used for lookups *and*
+        Return the sanitized colormap name without the ``'_r'`` suffix and
+        whether the colormap should be reversed. This is used for lookups *and*
         assignments.
         """
         if not isinstance(key, str):
             raise KeyError(f'Invalid key {key!r}. Key must be a string.')
         key = key.lower()
-        key = re.sub(r'\A(grays)(_r(_s)?|_s)?\Z', r'greys\2', key)
-        reverse = key[-2:] == '_r'
+        key = _KEY_GRAYS.sub(r'greys\2', key)
+        reverse = key.endswith('_r')
         if reverse:
             key = key[:-2]
         if mirror and not super().__contains__(key):  # search for mirrored key
-            key_mirror = key
-            for pair in CMAPS_DIVERGING:
-                try:
-                    idx = pair.index(key)
-                    key_mirror = pair[1 - idx]
-                except (ValueError, KeyError):
-                    continue
+            key_mirror = _CMAPS_MIRRORS.get(key, key)
             if super().__contains__(key_mirror):
                 reverse = not reverse
                 key = key_mirror
-        if reverse:
-            key = key + '_r'
-        return key
+        return key, reverse
 
 
 # Replace color database with custom database
@@ -2569,10 +2724,6 @@ if not isinstance(mcolors._colors_full_map, ColorDatabase):
 if mcm.get_cmap is not _get_cmap:
     mcm.get_cmap = _get_cmap
 if not isinstance(_cmap_database, ColormapDatabase):
-    _cmap_database = {
-        key: value for key, value in _cmap_database.items()
-        if key[-2:] != '_r' and key[-2:] != '_s'
-    }
     _cmap_database = ColormapDatabase(_cmap_database)
     setattr(mcm, _cmap_database_attr, _cmap_database)
 
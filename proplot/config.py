@@ -27,7 +27,7 @@ import numpy as np
 from . import colors as pcolors
 from .internals import ic  # noqa: F401
 from .internals import _not_none, docstring, rcsetup, timers, warnings
-from .utils import to_xyz, units
+from .utils import _to_xyz_array, units
 
 try:
     from matplotlib.cbook import _suppress_matplotlib_deprecation_warning  # mpl<3.4.0
@@ -1350,6 +1350,8 @@ def register_colors(user=True, default=False, space='hcl', margin=0.10):
     # Load colors from file and get their HCL values
     # NOTE: Colors that come *later* overwrite colors that come earlier.
     hex = re.compile(rf'\A{pcolors.HEX_PATTERN}\Z')  # match each string
+    translate = re.compile('|'.join(re.escape(pair[0]) for pair in TRANSLATE_COLORS))
+    remove = re.compile('|'.join(map(re.escape, ALWAYS_REMOVE)))
     for i, dirname, filename in _iter_data_paths('colors', user=user, default=default):
         path = os.path.join(dirname, filename)
         cat, ext = os.path.splitext(filename)
@@ -1394,7 +1396,6 @@ def register_colors(user=True, default=False, space='hcl', margin=0.10):
         elif cat == 'xkcd':
             # Always add these colors, but make sure not to add other
             # colors too close to them.
-            hcls = []
             filtered = []
             for name in ALWAYS_ADD:
                 color = loaded.pop(name, None)
@@ -1402,27 +1403,39 @@ def register_colors(user=True, default=False, space='hcl', margin=0.10):
                     continue
                 if 'grey' in name:
                     name = name.replace('grey', 'gray')
-                hcls.append(to_xyz(color, space=space))
                 filtered.append((name, color))
                 mcolors.colorConverter.colors[name] = color
                 XKCD_COLORS[name] = color
 
             # Get locations of "perceptually distinct" colors
             # WARNING: Unique axis argument requires numpy version >=1.13
+            # NOTE: Search each name once with a precompiled pattern and only apply
+            # the translations in sequence, since they can chain, if one matches.
             for name, color in loaded.items():
-                for string, replace in TRANSLATE_COLORS:
-                    if string in name:
-                        name = name.replace(string, replace)
-                if any(string in name for string in ALWAYS_REMOVE):
+                if translate.search(name):
+                    for string, replace in TRANSLATE_COLORS:
+                        if string in name:
+                            name = name.replace(string, replace)
+                if remove.search(name):
                     continue  # remove "unpofessional" names
-                hcls.append(to_xyz(color, space=space))
                 filtered.append((name, color))  # category name pair
-            hcls = np.asarray(hcls)
-            if not hcls.size:
+            if not filtered:
                 continue
+            # NOTE: Translate every color to the colorspace at once rather
+            # than calling to_xyz on each color.
+            hcls = mcolors.to_rgba_array([color for _, color in filtered])
+            hcls = _to_xyz_array(hcls[:, :3], space=space)
             hcls = hcls / np.array([360, 100, 100])
             hcls = np.round(hcls / margin).astype(np.int64)
-            _, idxs = np.unique(hcls, return_index=True, axis=0)
+            # NOTE: Pack each row into a single integer in lexicographic order so we
+            # can use the fast 1D unique rather than the row-wise axis=0 unique.
+            hcls -= hcls.min(axis=0)
+            try:
+                keys = np.ravel_multi_index(hcls.T, hcls.max(axis=0) + 1)
+            except ValueError:  # too many combinations for the integer keys
+                _, idxs = np.unique(hcls, return_index=True, axis=0)
+            else:
+                _, idxs = np.unique(keys, return_index=True)
 
             # Register "distinct" colors
             for idx in idxs:
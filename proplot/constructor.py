@@ -497,6 +497,21 @@ def Colormap(
             "'listed', 'linear', 'perceptual'."
         )
 
+    # Fast path for retrieving a single registered colormap without modifications
+    # NOTE: Results are not cached since the database can be modified and users
+    # can modify the returned colormaps in-place.
+    if (
+        len(args) == 1 and isinstance(args[0], str) and '.' not in args[0]
+        and not kwargs and not reverse and not to_listed and not save
+        and all(_ is None for _ in (name, cut, left, right, shift, samples))
+        and args[0] in pcolors._cmap_database
+    ):
+        cmap = pcolors._cmap_database[args[0]]
+        if not cmap._isinit:
+            cmap._init()
+        pcolors._cmap_database[cmap.name] = cmap
+        return cmap
+
     # Parse keyword args that can apply to the merged colormap or each
     # colormap individually.
     def _parse_modification(key, value):
@@ -752,16 +767,21 @@ def Cycle(
         name = _not_none(name, cmap.name)
 
         # Add colors to property dict
-        nprops = max(nprops, len(cmap.colors))
+        # NOTE: Colors are usually stored as an RGB(A) array. Convert it with
+        # tolist() rather than iterating over the array rows.
+        colors = cmap.colors
+        if isinstance(colors, np.ndarray):
+            colors = colors.tolist()
+        nprops = max(nprops, len(colors))
         props['color'] = [
             tuple(color) if not isinstance(color, str) else color
-            for color in cmap.colors
+            for color in colors
         ]  # save the tupled version!
 
     # Build cycler, make sure lengths are the same
     for key, value in props.items():
         if len(value) < nprops:  # double back if necessary
-            value[:] = [value[i % len(value)] for i in range(nprops)]
+            value[:] = (value * (nprops // len(value) + 1))[:nprops]
     cycle = cycler.cycler(**props)
     cycle.name = _not_none(name, '_no_name')
     return cycle
@@ -14,7 +14,7 @@ from . import constructor, ui
 from .config import BASE_COLORS, OPEN_COLORS, XKCD_COLORS, _get_data_paths, rc
 from .internals import ic  # noqa: F401
 from .internals import _not_none, docstring
-from .utils import to_rgb, to_xyz
+from .utils import _to_rgb_array, _to_xyz_array, to_xyz
 
 __all__ = [
     'show_cmaps',
@@ -219,30 +219,30 @@ def _draw_bars(
             name = name[:-2]
         database[name] = cmap
 
-    # Categorize the input names
+    # Get the categories to be shown
+    if categories is None:
+        categories = source.keys() - {'MATLAB', 'GNUplot', 'GIST', 'Other'}
+    if any(cat not in source for cat in categories):
+        raise ValueError(
+            f'Invalid categories {categories!r}. Options are: '
+            + ', '.join(map(repr, source)) + '.'
+        )
+
+    # Categorize the input names, skipping categories that are not shown
     cmapdict = {}
     names_all = list(map(str.lower, database.keys()))
-    names_known = list(map(str.lower, sum(map(list, source.values()), [])))
+    names_known = frozenset(name.lower() for names in source.values() for name in names)
     names_unknown = [name for name in names_all if name not in names_known]
     if unknown and names_unknown:
         cmapdict[unknown] = names_unknown
+    names_all = frozenset(names_all)
     for cat, names in source.items():
+        if cat not in categories:
+            continue
         names_cat = [name for name in names if name.lower() in names_all]
         if names_cat:
             cmapdict[cat] = names_cat
 
-    # Filter out certain categories
-    if categories is None:
-        categories = source.keys() - {'MATLAB', 'GNUplot', 'GIST', 'Other'}
-    if any(cat not in source for cat in categories):
-        raise ValueError(
-            f'Invalid categories {categories!r}. Options are: '
-            + ', '.join(map(repr, source)) + '.'
-        )
-    for cat in (*cmapdict,):
-        if cat not in categories and cat != unknown:
-            cmapdict.pop(cat)
-
     # Draw figure
     naxs = len(cmapdict) + sum(map(len, cmapdict.values()))
     fig, axs = ui.subplots(
@@ -322,10 +322,10 @@ def show_channels(
     array = [[1, 1, 2, 2, 3, 3]]
     labels = ('Hue', 'Chroma', 'Luminance')
     if saturation:
-        array += [[0, 4, 4, 5, 5, 0]]
+        array.append([0, 4, 4, 5, 5, 0])
         labels += ('HSL saturation', 'HPL saturation')
     if rgb:
-        array += [np.array([4, 4, 5, 5, 6, 6]) + 2 * int(saturation)]
+        array.append(np.array([4, 4, 5, 5, 6, 6]) + 2 * int(saturation))
         labels += ('Red', 'Green', 'Blue')
     fig, axs = ui.subplots(
         array=array, span=False, share=1,
@@ -347,9 +347,9 @@ def show_channels(
         x = np.linspace(0, 1, N)
         lut = cmap._lut[:-3, :3].copy()
         rgb_data = lut.T  # 3 by N
-        hcl_data = np.array([to_xyz(color, space='hcl') for color in lut]).T  # 3 by N
-        hsl_data = [to_xyz(color, space='hsl')[1] for color in lut]
-        hpl_data = [to_xyz(color, space='hpl')[1] for color in lut]
+        hcl_data = _to_xyz_array(lut, 'hcl').T  # 3 by N
+        hsl_data = _to_xyz_array(lut, 'hsl')[:, 1]
+        hpl_data = _to_xyz_array(lut, 'hpl')[:, 1]
 
         # Plot channels
         # If rgb is False, the zip will just truncate the other iterables
@@ -474,14 +474,14 @@ def show_colorspaces(*, luminance=None, saturation=None, hue=None, axwidth=2):
         ncols=3, share=0, axwidth=axwidth, aspect=1, axpad=0.05
     )
     for ax, space in zip(axs, ('hcl', 'hsl', 'hpl')):
-        rgba = np.ones((*hsl.shape[:2][::-1], 4))  # RGBA
-        for j in range(hsl.shape[0]):
-            for k in range(hsl.shape[1]):
-                rgb_jk = to_rgb(hsl[j, k, :].flat, space)
-                if not all(0 <= c <= 1 for c in rgb_jk):
-                    rgba[k, j, 3] = 0  # black cell
-                else:
-                    rgba[k, j, :3] = rgb_jk
+        # NOTE: Translate the whole cross-section at once rather than
+        # calling to_rgb on each cell.
+        rgb = _to_rgb_array(hsl.reshape(-1, 3), space)
+        rgb = rgb.reshape(hsl.shape).swapaxes(0, 1)
+        valid = ((rgb >= 0) & (rgb <= 1)).all(axis=2)
+        rgba = np.ones((*rgb.shape[:2], 4))  # RGBA
+        rgba[valid, :3] = rgb[valid]
+        rgba[~valid, 3] = 0  # black cell
         ax.imshow(rgba, origin='lower', aspect='auto')
         ax.format(
             xlabel=xlabel, ylabel=ylabel, suptitle=suptitle,
@@ -33,6 +33,8 @@ Provided by this module:
 import math
 from colorsys import hls_to_rgb, rgb_to_hls
 
+import numpy as np
+
 # Coefficients or something
 m = [
     [3.2406, -1.5372, -0.4986],
@@ -341,3 +343,186 @@ def CIEluv_to_CIExyz(triple):
     X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
     Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
     return [X, Y, Z]
+
+
+# Vectorized versions of the above conversions added for ProPlot. These accept
+# and return (N, 3) arrays of channel values and give identical results to the
+# scalar versions, without calling a python function for every color.
+def _from_linear_array(c):
+    c = np.asarray(c, dtype=float)
+    out = 12.92 * c
+    mask = c > 0.0031308  # only take powers where needed
+    out[mask] = 1.055 * np.power(c[mask], 1.0 / 2.4) - 0.055
+    return out
+
+
+def _to_linear_array(c):
+    c = np.asarray(c, dtype=float)
+    out = c / 12.92
+    mask = c > 0.04045  # only take powers where needed
+    out[mask] = np.power((c[mask] + 0.055) / 1.055, 2.4)
+    return out
+
+
+def _max_chroma_array(L, H):
+    hrad = np.radians(H)
+    sinH = np.sin(hrad)
+    cosH = np.cos(hrad)
+    sub1 = (L + 16.0) ** 3 / 1560896.0
+    sub2 = np.where(sub1 > 0.008856, sub1, L / 903.3)
+    result = np.full(np.shape(L), np.inf)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for m1, m2, m3 in m:
+            top = (0.99915 * m1 + 1.05122 * m2 + 1.14460 * m3) * sub2
+            rbottom = 0.86330 * m3 - 0.17266 * m2
+            lbottom = 0.12949 * m3 - 0.38848 * m1
+            bottom = (rbottom * sinH + lbottom * cosH) * sub2
+            for t in (0.0, 1.0):
+                C = L * (top - 1.05122 * t) / (bottom + 0.17266 * sinH * t)
+                result = np.where((C > 0.0) & (C < result), C, result)
+    return result
+
+
+def _max_chroma_pastel_array(L):
+    # NOTE: The chroma at the hue extremum is the minimum of the candidate
+    # chromas, so there is no need to convert the extremum hue back again.
+    lhs = (L ** 3 + 48.0 * L ** 2 + 768.0 * L + 4096.0) / 1560896.0
+    rhs = 1107.0 / 125000.0
+    sub = np.where(lhs > rhs, lhs, 10.0 * L / 9033.0)
+    chroma = np.full(np.shape(L), np.inf)
+    for m1, m2, m3 in m:
+        for limit in (0.0, 1.0):
+            top = -3015466475.0 * m3 * sub + 603093295.0 * m2 * sub \
+                - 603093295.0 * limit
+            bottom = 1356959916.0 * m1 * sub - 452319972.0 * m3 * sub
+            hrad = np.arctan2(top, bottom)
+            if limit == 0.0:
+                hrad += math.pi
+            chroma = np.minimum(chroma, _max_chroma_array(L, np.degrees(hrad)))
+    return chroma
+
+
+def _hsl_to_lchuv_array(triple, pastel=False):
+    H, S, L = np.asarray(triple, dtype=float).T
+    mx = _max_chroma_pastel_array(L) if pastel else _max_chroma_array(L, H)
+    C = mx * S / 100.0
+    light = L > 99.9999999
+    dark = L < 0.00000001
+    L = np.where(light, 100.0, np.where(dark, 0.0, L))
+    C = np.where(light | dark, 0.0, C)
+    return np.stack((L, C, H), axis=-1)
+
+
+def _lchuv_to_hsl_array(triple, pastel=False):
+    L, C, H = np.asarray(triple, dtype=float).T
+    mx = _max_chroma_pastel_array(L) if pastel else _max_chroma_array(L, H)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        S = 100.0 * C / mx
+    light = L > 99.9999999
+    dark = L < 0.00000001
+    S = np.where(light | dark, 0.0, S)
+    L = np.where(light, 100.0, np.where(dark, 0.0, L))
+    return np.stack((H, S, L), axis=-1)
+
+
+def _lchuv_to_rgb_array(triple):
+    L, C, H = np.asarray(triple, dtype=float).T
+    hrad = np.radians(H)
+    U = np.cos(hrad) * C
+    V = np.sin(hrad) * C
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (L + 16.0) / 116.0
+        varY = np.where(t ** 3 > lab_e, t ** gamma, (116.0 * t - 16.0) / lab_k)
+        varU = U / (13.0 * L) + refU
+        varV = V / (13.0 * L) + refV
+        Y = varY * refY
+        X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
+        Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
+    xyz = np.stack((X, Y, Z), axis=-1)
+    xyz[L == 0] = 0.0
+    return _from_linear_array(xyz @ np.array(m).T)
+
+
+def _rgb_to_lchuv_array(triple):
+    rgbl = _to_linear_array(triple)
+    X, Y, Z = (rgbl @ np.array(m_inv).T).T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        denom = X + (15.0 * Y) + (3.0 * Z)
+        varU = (4.0 * X) / denom
+        varV = (9.0 * Y) / denom
+        t = Y / refY
+        L = 116.0 * np.where(
+            t > lab_e, np.power(np.maximum(t, lab_e), 1.0 / gamma),
+            7.787 * t + 16.0 / 116.0
+        ) - 16.0
+    black = (L == 0.0) | ((X == 0.0) & (Y == 0.0) & (Z == 0.0))
+    L = np.where(black, 0.0, L)
+    U = np.where(black, 0.0, 13.0 * L * (varU - refU))
+    V = np.where(black, 0.0, 13.0 * L * (varV - refV))
+    C = np.hypot(U, V)
+    H = np.degrees(np.arctan2(V, U))
+    H = np.where(H < 0.0, 360.0 + H, H)
+    return np.stack((L, C, H), axis=-1)
+
+
+def hsl_to_rgb_array(triple):
+    h, s, l = (np.asarray(triple, dtype=float) / (360.0, 100.0, 100.0)).T  # noqa
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    channels = []
+    for hue in (h + 1.0 / 3.0, h, h - 1.0 / 3.0):
+        hue = hue % 1.0
+        channels.append(np.select(
+            (hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0),
+            (m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0),
+            m1,
+        ))
+    rgb = np.stack(channels, axis=-1)
+    gray = s == 0.0
+    rgb[gray] = l[gray, None]
+    return rgb
+
+
+def rgb_to_hsl_array(triple):
+    rgb = np.asarray(triple, dtype=float)
+    r, g, b = rgb.T
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0  # noqa
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.select((r == maxc, g == maxc), (bc - gc, 2.0 + rc - bc), 4.0 + gc - rc)
+    h = (h / 6.0) % 1.0
+    gray = minc == maxc
+    h = np.where(gray, 0.0, h)
+    s = np.where(gray, 0.0, s)
+    return np.stack((h * 360.0, s * 100.0, l * 100.0), axis=-1)
+
+
+def hcl_to_rgb_array(triple):
+    return _lchuv_to_rgb_array(np.asarray(triple, dtype=float)[:, ::-1])
+
+
+def rgb_to_hcl_array(triple):
+    return _rgb_to_lchuv_array(triple)[:, ::-1]
+
+
+def hsluv_to_rgb_array(triple):
+    return _lchuv_to_rgb_array(_hsl_to_lchuv_array(triple))
+
+
+def rgb_to_hsluv_array(triple):
+    return _lchuv_to_hsl_array(_rgb_to_lchuv_array(triple))
+
+
+def hpluv_to_rgb_array(triple):
+    return _lchuv_to_rgb_array(_hsl_to_lchuv_array(triple, pastel=True))
+
+
+def rgb_to_hpluv_array(triple):
+    return _lchuv_to_hsl_array(_rgb_to_lchuv_array(triple), pastel=True)
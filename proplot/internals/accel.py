@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Numerical kernels accelerated with numba when it is installed. Every kernel
+has a pure numpy fallback with identical results.
+"""
+# NOTE: The numba kernels live in the kernels module, which is only imported
+# for inputs large enough to amortize importing numba and loading the compiled
+# kernels. This costs a fraction of a second, far more than the numpy versions
+# spend on e.g. colormap lookup tables or label colors.
+import numpy as np
+
+from ..externals import hsluv
+
+# Minimum input size for using the numba kernels
+_NUMBA_MIN_SIZE = 100000
+_kernels = None
+
+# Constants used to get the relative luminance (Y) and the luminance (L) channels
+_Y_COEFFS = tuple(hsluv.m_inv[1])  # row of the RGB --> CIE XYZ matrix
+_REF_Y = hsluv.refY
+_LAB_E = hsluv.lab_e
+
+# Constants used to convert from the HCL-like colorspaces to RGB
+_M = tuple(tuple(row) for row in hsluv.m)  # CIE XYZ --> RGB matrix
+_REF_U = hsluv.refU
+_REF_V = hsluv.refV
+_LAB_K = hsluv.lab_k
+_GAMMA = hsluv.gamma
+_SPACES = {'hcl': 0, 'hsl': 1, 'hpl': 2}
+_TO_RGB = {
+    'hsv': hsluv.hsl_to_rgb_array,
+    'hcl': hsluv.hcl_to_rgb_array,
+    'hsl': hsluv.hsluv_to_rgb_array,
+    'hpl': hsluv.hpluv_to_rgb_array,
+}
+
+
+def _get_kernels(size):
+    """
+    Return the numba kernels module, or ``None`` if numba is not installed or
+    the input size is too small to benefit from the kernels.
+    """
+    global _kernels
+    if size < _NUMBA_MIN_SIZE:
+        return None
+    if _kernels is None:
+        try:
+            from . import kernels
+        except ImportError:
+            kernels = False
+        _kernels = kernels
+    return _kernels or None
+
+
+def _luminance_numpy(rgb):
+    """
+    Return the HCL luminance of an (N, 3) RGB array using numpy.
+    """
+    rgb = np.where(rgb > 0.04045, ((rgb + 0.055) / 1.055) ** 2.4, rgb / 12.92)
+    y = rgb @ np.array(_Y_COEFFS) / _REF_Y
+    y = np.where(y > _LAB_E, np.cbrt(y), 7.787 * y + 16.0 / 116.0)
+    return 116.0 * y - 16.0
+
+
+def _mapping_array_numpy(xq, x, y0, y1, gammas, inverse):
+    """
+    Return the lookup table for the segment data using numpy.
+    """
+    # Get distances from the segmentdata entry to the *left* for each requested
+    # level, excluding ends at (0,1), which must exactly match segmentdata ends.
+    # Here xq[i] must be inserted so it is larger than x[ind[i]-1] but
+    # smaller than x[ind[i]]
+    ind = np.searchsorted(x, xq)[1:-1]
+    distance = (xq[1:-1] - x[ind - 1]) / (x[ind] - x[ind - 1])
+
+    # Scale distances in each segment by input gamma
+    # The relevant 'segment' is to the *left* of index returned by searchsorted.
+    # By default we weight toward a *lower* channel value, but only for segments
+    # with more than one color, and skip segments where the gamma is 1.
+    gamma = gammas[ind - 1]
+    scale = gamma != 1
+    if scale.any():
+        _, inv, counts = np.unique(ind, return_inverse=True, return_counts=True)
+        ireverse = (counts[inv] > 1) & ((y0[ind] - y1[ind - 1]) < 0)
+        if inverse:
+            ireverse = ~ireverse
+        ireverse &= scale
+        distance = np.where(
+            ireverse, 1 - (1 - distance) ** gamma, distance ** gamma
+        )
+
+    # Perform successive linear interpolations all rolled up into one equation
+    lut = np.zeros(xq.shape, float)
+    lut[1:-1] = distance * (y0[ind] - y1[ind - 1]) + y1[ind - 1]
+    lut[0] = y1[0]
+    lut[-1] = y0[-1]
+    return lut
+
+
+def _discretize_numpy(xq, bins, dest):
+    """
+    Return the destination value for the bin of each value using numpy.
+    """
+    return dest[np.searchsorted(bins, xq)]
+
+
+def to_rgb(colors, space):
+    """
+    Translate an array of HSV, HCL, HSLuv, or HPLuv colors to RGB. This gives
+    the same result as calling ``to_rgb(color, space)`` on each color.
+
+    Parameters
+    ----------
+    colors : array-like
+        An (N, 3) array of hue, saturation or chroma, and luminance values.
+    space : {'hsv', 'hcl', 'hsl', 'hpl'}
+        The colorspace for the input channel values.
+
+    Returns
+    -------
+    rgb : ndarray
+        The (N, 3) array of red, green, and blue values.
+    """
+    xyz = np.ascontiguousarray(colors, dtype=np.float64).reshape(-1, 3)
+    kernels = _get_kernels(xyz.shape[0])
+    if kernels is None:
+        return _TO_RGB[space](xyz)
+    rgb = np.empty_like(xyz)
+    if space == 'hsv':
+        kernels.hsv_to_rgb(xyz, rgb)
+    else:
+        kernels.to_rgb(xyz, _SPACES[space], rgb)
+    return rgb
+
+
+def mapping_array(xq, x, y0, y1, gammas, inverse=False):
+    """
+    Return the colormap lookup table for the segment data. This is used by
+    `~proplot.colors.make_mapping_array` after validating the input.
+
+    Parameters
+    ----------
+    xq : ndarray
+        The lookup table coordinates scaled from ``0`` to ``N - 1``.
+    x, y0, y1 : ndarray
+        The segment data columns with `x` scaled from ``0`` to ``N - 1``.
+    gammas : ndarray
+        The gamma for each segment.
+    inverse : bool, optional
+        Whether to weight the gamma scaling toward higher channel values.
+
+    Returns
+    -------
+    lut : ndarray
+        The lookup table.
+    """
+    args = tuple(np.ascontiguousarray(a, dtype=np.float64) for a in (xq, x, y0, y1))
+    gammas = np.ascontiguousarray(gammas, dtype=np.float64)
+    kernels = _get_kernels(args[0].size)
+    if kernels is None:
+        return _mapping_array_numpy(*args, gammas, bool(inverse))
+    lut = np.empty(args[0].shape)
+    kernels.mapping_array(*args, gammas, bool(inverse), lut)
+    return lut
+
+
+def discretize(values, bins, dest):
+    """
+    Return the destination value for the bin containing each value. This gives
+    the same result as ``dest[np.searchsorted(bins, values)]``.
+
+    Parameters
+    ----------
+    values : array-like
+        The values to be binned.
+    bins : ndarray
+        The monotonically increasing bin edges.
+    dest : ndarray
+        The destination values with length ``bins.size + 1``.
+
+    Returns
+    -------
+    out : ndarray
+        The destination values with the same shape as `values`.
+    """
+    xq = np.asarray(values, dtype=np.float64)
+    kernels = _get_kernels(xq.size)
+    if kernels is None:
+        return _discretize_numpy(xq, bins, dest)
+    bins = np.ascontiguousarray(bins, dtype=np.float64)
+    dest = np.ascontiguousarray(dest, dtype=np.float64)
+    out = np.empty(xq.shape)
+    kernels.discretize(np.ascontiguousarray(xq).ravel(), bins, dest, out.ravel())
+    return out
+
+
+def luminance(colors):
+    """
+    Return the HCL luminance channel for an array of RGB or RGBA colors. This
+    gives the same result as calling ``to_xyz(color, 'hcl')[2]`` on each color.
+
+    Parameters
+    ----------
+    colors : array-like
+        An (N, 3) or (N, 4) array of color channel values between ``0`` and ``1``.
+
+    Returns
+    -------
+    lums : ndarray
+        The luminance values between ``0`` and ``100``.
+    """
+    rgb = np.asarray(colors, dtype=np.float64)[:, :3]
+    kernels = _get_kernels(rgb.shape[0])
+    if kernels is None:
+        return _luminance_numpy(rgb)
+    lums = np.empty(rgb.shape[0])
+    kernels.luminance(rgb, lums)
+    return lums
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Numba kernels used by `proplot.internals.accel`. This module requires numba.
+"""
+# NOTE: Only import this module through accel._get_kernels(). Importing numba
+# and loading the compiled kernels is slow, so this is deferred until an input
+# is large enough to benefit from the kernels.
+import numba
+import numpy as np
+
+from .accel import _GAMMA, _LAB_E, _LAB_K, _M, _REF_U, _REF_V, _REF_Y, _Y_COEFFS
+
+
+# NOTE: Kernels release the GIL so figures can be drawn from multiple threads,
+# and are cached to disk so they are only compiled once per installation.
+@numba.njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def luminance(rgb, out):
+    """
+    Write the HCL luminance of an (N, 3) RGB array to `out` using numba.
+    """
+    for i in numba.prange(rgb.shape[0]):
+        y = 0.0
+        for j in range(3):
+            c = rgb[i, j]
+            if c > 0.04045:
+                c = ((c + 0.055) / 1.055) ** 2.4
+            else:
+                c = c / 12.92
+            y += _Y_COEFFS[j] * c
+        y /= _REF_Y
+        if y > _LAB_E:
+            y = y ** (1.0 / 3.0)
+        else:
+            y = 7.787 * y + 16.0 / 116.0
+        out[i] = 116.0 * y - 16.0
+
+
+@numba.njit(nogil=True, cache=True)
+def mapping_array(xq, x, y0, y1, gammas, inverse, out):
+    """
+    Write the lookup table for the segment data to `out` using numba.
+    """
+    # Get the segment to the *left* of each level with a running cursor,
+    # since the levels are sorted, then count the levels in each segment
+    n = xq.size
+    ind = np.empty(n, np.int64)
+    j = 0
+    for i in range(1, n - 1):
+        while x[j] < xq[i]:
+            j += 1
+        ind[i] = j
+    counts = np.zeros(x.size, np.int64)
+    for i in range(1, n - 1):
+        counts[ind[i]] += 1
+    # Scale distances by the segment gamma and interpolate
+    for i in range(1, n - 1):
+        j = ind[i]
+        distance = (xq[i] - x[j - 1]) / (x[j] - x[j - 1])
+        gamma = gammas[j - 1]
+        if gamma != 1:
+            ireverse = counts[j] > 1 and (y0[j] - y1[j - 1]) < 0
+            if inverse:
+                ireverse = not ireverse
+            if ireverse:
+                distance = 1 - (1 - distance) ** gamma
+            else:
+                distance = distance ** gamma
+        out[i] = distance * (y0[j] - y1[j - 1]) + y1[j - 1]
+    out[0] = y1[0]
+    out[n - 1] = y0[-1]
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def discretize(xq, bins, dest, out):
+    """
+    Write the destination value for the bin of each value to `out` using numba.
+    """
+    # NOTE: This is an inline binary search equivalent to np.searchsorted
+    # with side='left', which also sorts NaN values to the end.
+    n = bins.size
+    for i in numba.prange(xq.size):
+        v = xq[i]
+        lo = 0
+        hi = n
+        if v != v:
+            lo = n
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if bins[mid] < v:
+                lo = mid + 1
+            else:
+                hi = mid
+        out[i] = dest[lo]
+
+
+# NOTE: These kernels mirror the scalar functions in the hsluv module. They
+# do not use fastmath because the chroma search compares against infinity.
+@numba.njit(nogil=True, cache=True)
+def max_chroma(L, H):
+    """
+    Return the maximum chroma for the luminance and hue using numba.
+    """
+    hrad = np.radians(H)
+    sinH = np.sin(hrad)
+    cosH = np.cos(hrad)
+    sub1 = (L + 16.0) ** 3 / 1560896.0
+    sub2 = sub1 if sub1 > 0.008856 else L / 903.3
+    result = np.inf
+    for i in range(3):
+        m1, m2, m3 = _M[i]
+        top = (0.99915 * m1 + 1.05122 * m2 + 1.14460 * m3) * sub2
+        rbottom = 0.86330 * m3 - 0.17266 * m2
+        lbottom = 0.12949 * m3 - 0.38848 * m1
+        bottom = (rbottom * sinH + lbottom * cosH) * sub2
+        for t in (0.0, 1.0):
+            C = L * (top - 1.05122 * t) / (bottom + 0.17266 * sinH * t)
+            if C > 0.0 and C < result:
+                result = C
+    return result
+
+
+@numba.njit(nogil=True, cache=True)
+def max_chroma_pastel(L):
+    """
+    Return the maximum chroma for the luminance across all hues using numba.
+    """
+    lhs = (L ** 3 + 48.0 * L ** 2 + 768.0 * L + 4096.0) / 1560896.0
+    rhs = 1107.0 / 125000.0
+    sub = lhs if lhs > rhs else 10.0 * L / 9033.0
+    chroma = np.inf
+    for i in range(3):
+        m1, m2, m3 = _M[i]
+        for limit in (0.0, 1.0):
+            top = (
+                -3015466475.0 * m3 * sub + 603093295.0 * m2 * sub
+                - 603093295.0 * limit
+            )
+            bottom = 1356959916.0 * m1 * sub - 452319972.0 * m3 * sub
+            hrad = np.arctan2(top, bottom)
+            if limit == 0.0:
+                hrad += np.pi
+            chroma = min(chroma, max_chroma(L, np.degrees(hrad)))
+    return chroma
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def to_rgb(xyz, space, out):
+    """
+    Write the RGB translation of an (N, 3) array of HCL, HSLuv, or HPLuv
+    channel values to `out` using numba.
+    """
+    for i in numba.prange(xyz.shape[0]):
+        # Get the LCh channels
+        H, S, L = xyz[i, 0], xyz[i, 1], xyz[i, 2]
+        if space == 0:
+            C = S
+        elif L > 99.9999999:
+            L, C = 100.0, 0.0
+        elif L < 0.00000001:
+            L, C = 0.0, 0.0
+        elif space == 1:
+            C = max_chroma(L, H) * S / 100.0
+        else:
+            C = max_chroma_pastel(L) * S / 100.0
+        # Convert to CIE XYZ
+        if L == 0:
+            X = Y = Z = 0.0
+        else:
+            hrad = np.radians(H)
+            U = np.cos(hrad) * C
+            V = np.sin(hrad) * C
+            t = (L + 16.0) / 116.0
+            if t ** 3 > _LAB_E:
+                Y = t ** _GAMMA
+            else:
+                Y = (116.0 * t - 16.0) / _LAB_K
+            varU = U / (13.0 * L) + _REF_U
+            varV = V / (13.0 * L) + _REF_V
+            Y = Y * _REF_Y
+            X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
+            Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
+        # Convert to RGB
+        for j in range(3):
+            m1, m2, m3 = _M[j]
+            c = m1 * X + m2 * Y + m3 * Z
+            if c <= 0.0031308:
+                out[i, j] = 12.92 * c
+            else:
+                out[i, j] = 1.055 * c ** (1.0 / 2.4) - 0.055
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def hsv_to_rgb(xyz, out):
+    """
+    Write the RGB translation of an (N, 3) array of HSV (i.e. HLS) channel
+    values to `out` using numba. This mirrors `colorsys.hls_to_rgb`.
+    """
+    for i in numba.prange(xyz.shape[0]):
+        h = xyz[i, 0] / 360.0
+        s = xyz[i, 1] / 100.0
+        l = xyz[i, 2] / 100.0  # noqa: E741
+        if s == 0.0:
+            out[i, 0] = out[i, 1] = out[i, 2] = l
+            continue
+        if l <= 0.5:
+            m2 = l * (1.0 + s)
+        else:
+            m2 = l + s - (l * s)
+        m1 = 2.0 * l - m2
+        for j in range(3):
+            hue = (h + (1.0 - j) / 3.0) % 1.0
+            if hue < 1.0 / 6.0:
+                out[i, j] = m1 + (m2 - m1) * hue * 6.0
+            elif hue < 0.5:
+                out[i, j] = m2
+            elif hue < 2.0 / 3.0:
+                out[i, j] = m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0
+            else:
+                out[i, j] = m1
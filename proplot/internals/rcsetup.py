@@ -680,6 +680,15 @@ _rc_proplot = {
         'Font weight for row labels on the left-hand side.'
     ),
 
+    # Legend additions
+    'legend.bestmax': (
+        None,
+        "Maximum number of data points in the axes for which the ``'best'`` "
+        'legend location is used. For larger datasets, the expensive search for '
+        "the best location is skipped and ``'upper right'`` is used instead. "
+        "If ``None`` (the default), the ``'best'`` location is always used."
+    ),
+
     # Edge width bulk setting
     'linewidth': (
         LINEWIDTH,
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from proplot.internals import accel
+
+
+@pytest.fixture(params=[False, True], ids=['numpy', 'numba'])
+def use_numba(request, monkeypatch):
+    """Runs each test with the numpy fallbacks and with the numba kernels."""
+    if request.param:
+        pytest.importorskip('numba')
+        monkeypatch.setattr(accel, '_NUMBA_MIN_SIZE', 0)
+    else:
+        monkeypatch.setattr(accel, '_NUMBA_MIN_SIZE', np.inf)
+    return request.param
+
+
+def test_luminance(use_numba):
+    """Tests that the luminance matches the numpy fallback."""
+    rgb = np.random.rand(100, 4)
+    assert np.allclose(accel.luminance(rgb), accel._luminance_numpy(rgb[:, :3]))
+
+
+@pytest.mark.parametrize('inverse', [False, True])
+def test_mapping_array(use_numba, inverse):
+    """Tests that gamma-scaled lookup tables match the numpy fallback."""
+    xq = 255 * np.linspace(0, 1, 256)
+    x = 255 * np.array([0, 0.3, 0.3, 1])
+    y0 = np.array([0, 0.5, 0.2, 1])
+    y1 = np.array([0, 0.4, 0.2, 1])
+    gammas = np.array([2, 1, 0.5, 1])
+    args = (xq, x, y0, y1, gammas, inverse)
+    assert np.allclose(accel.mapping_array(*args), accel._mapping_array_numpy(*args))
+
+
+def test_discretize(use_numba):
+    """Tests that binned values, including NaN, match the numpy fallback."""
+    bins = np.sort(np.random.rand(10))
+    dest = np.linspace(0, 1, 11)
+    values = np.append(np.random.rand(10, 10) * 1.2 - 0.1, np.nan)
+    result = accel.discretize(values, bins, dest)
+    assert np.array_equal(result, accel._discretize_numpy(values, bins, dest))
+
+
+@pytest.mark.parametrize('space', ['hsv', 'hcl', 'hsl', 'hpl'])
+def test_to_rgb(use_numba, space):
+    """Tests that colorspace translations match the hsluv array functions."""
+    xyz = np.random.rand(100, 3) * (360, 100, 100)
+    assert np.allclose(accel.to_rgb(xyz, space), accel._TO_RGB[space](xyz))
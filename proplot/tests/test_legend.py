@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+import proplot as plot
+from proplot.internals import warnings
+
+
+def _legend_loc(npoints):
+    """Return the location code of a 'best' legend for a single line."""
+    fig, axs = plot.subplots()
+    axs[0].plot(np.random.rand(npoints), label='label')
+    return axs[0].legend(loc='best')._loc
+
+
+def test_legend_bestmax_default():
+    """Tests that the 'best' location is kept for large datasets by default."""
+    assert _legend_loc(200000) == 0
+
+
+def test_legend_bestmax():
+    """Tests that 'best' falls back to 'upper right' above legend.bestmax."""
+    with plot.rc.context({'legend.bestmax': 1000}):
+        with pytest.warns(warnings.ProPlotWarning):
+            loc = _legend_loc(2000)
+    assert loc == 1
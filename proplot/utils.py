@@ -2,6 +2,7 @@
 """
 Various tools that may be useful while making plots.
 """
+import functools
 import re
 from numbers import Integral, Number
 
@@ -23,6 +24,7 @@ __all__ = [
 ]
 
 NUMBER = re.compile(r'\A([-+]?[0-9._]+(?:[eE][-+]?[0-9_]+)?)(.*)\Z')
+CYCLE = re.compile(r'\AC[0-9]\Z')
 UNIT_DICT = {
     'in': 1.0,
     'ft': 12.0,
@@ -36,6 +38,20 @@ UNIT_DICT = {
     'ly': 3.725e+17,
 }
 
+# Colorspace conversion functions keyed by colorspace name
+XYZ_TO_RGB = {
+    'hsv': (hsluv.hsl_to_rgb, hsluv.hsl_to_rgb_array),
+    'hcl': (hsluv.hcl_to_rgb, hsluv.hcl_to_rgb_array),
+    'hsl': (hsluv.hsluv_to_rgb, hsluv.hsluv_to_rgb_array),
+    'hpl': (hsluv.hpluv_to_rgb, hsluv.hpluv_to_rgb_array),
+}
+RGB_TO_XYZ = {
+    'hsv': (hsluv.rgb_to_hsl, hsluv.rgb_to_hsl_array),  # rgb_to_hsv would also work
+    'hcl': (hsluv.rgb_to_hcl, hsluv.rgb_to_hcl_array),
+    'hsl': (hsluv.rgb_to_hsluv, hsluv.rgb_to_hsluv_array),
+    'hpl': (hsluv.rgb_to_hpluv, hsluv.rgb_to_hpluv_array),
+}
+
 # Shared parameters
 docstring.snippets['param.rgba'] = """
 color : color-spec
@@ -375,6 +391,11 @@ def to_rgb(color, space='rgb', cycle=None):
     --------
     to_rgba, to_xyz
     """
+    # Skip parsing for RGB float tuples that need no translation or scaling
+    if space == 'rgb' and type(color) is tuple and len(color) == 3:
+        r, g, b = color
+        if type(r) is type(g) is type(b) is float and max(r, g, b) <= 2:
+            return color
     return to_rgba(color, space=space, cycle=cycle)[:3]
 
 
@@ -397,8 +418,14 @@ def to_rgba(color, space='rgb', cycle=None):
     --------
     to_rgb, to_xyza
     """
+    # Skip parsing for RGB(A) float tuples that need no translation or scaling
+    if space == 'rgb' and type(color) is tuple and 3 <= len(color) <= 4:
+        r, g, b, *a = color
+        if type(r) is type(g) is type(b) is float and max(r, g, b) <= 2:
+            return color if a else (r, g, b, 1)
+
     # Convert color cycle strings
-    if isinstance(color, str) and re.match(r'\AC[0-9]\Z', color):
+    if isinstance(color, str) and CYCLE.match(color):
         if isinstance(cycle, str):
             from .colors import _cmap_database
             try:
@@ -439,21 +466,14 @@ def to_rgba(color, space='rgb', cycle=None):
     # Translate arbitrary colorspaces
     if space == 'rgb':
         try:
-            if any(c > 2 for c in color):
-                color = [c / 255 for c in color]  # scale to within 0-1
-            color = tuple(color)
+            r, g, b = color
+            if r > 2 or g > 2 or b > 2:
+                r, g, b = r / 255, g / 255, b / 255  # scale to within 0-1
+            color = (r, g, b)
         except (ValueError, TypeError):
             raise ValueError(f'Invalid RGB argument {color!r}.')
-    elif space == 'hsv':
-        color = hsluv.hsl_to_rgb(*color)
-    elif space == 'hcl':
-        color = hsluv.hcl_to_rgb(*color)
-    elif space == 'hsl':
-        color = hsluv.hsluv_to_rgb(*color)
-    elif space == 'hpl':
-        color = hsluv.hpluv_to_rgb(*color)
     else:
-        raise ValueError('Invalid color {color!r} for colorspace {space!r}.')
+        color = _xyz_to_rgb(tuple(color), space)
 
     # Return RGB or RGBA
     return (*color, opacity)
@@ -508,21 +528,74 @@ def to_xyza(color, space='hcl'):
     # NOTE: Don't pass color tuple, because we may want to permit
     # out-of-bounds RGB values to invert conversion
     *color, opacity = to_rgba(color)
-    if space == 'rgb':
-        pass
-    elif space == 'hsv':
-        color = hsluv.rgb_to_hsl(*color)  # rgb_to_hsv would also work
-    elif space == 'hcl':
-        color = hsluv.rgb_to_hcl(*color)
-    elif space == 'hsl':
-        color = hsluv.rgb_to_hsluv(*color)
-    elif space == 'hpl':
-        color = hsluv.rgb_to_hpluv(*color)
-    else:
-        raise ValueError(f'Invalid colorspace {space}.')
+    if space != 'rgb':
+        color = _rgb_to_xyz(tuple(color), space)
     return (*color, opacity)
 
 
+# NOTE: Colors are frequently converted between the same RGB and colorspace
+# channel values, e.g. when building colormaps from color names. The conversions
+# are pure python, so cache them. Color names are not cached here because
+# matplotlib already caches them and their values can change.
+@functools.lru_cache(maxsize=4096)
+def _xyz_to_rgb(color, space):
+    """
+    Translate a tuple of channel values in any colorspace to an RGB tuple.
+    """
+    try:
+        func, _ = XYZ_TO_RGB[space]
+    except (KeyError, TypeError):
+        raise ValueError(f'Invalid color {color!r} for colorspace {space!r}.')
+    return tuple(func(*color))
+
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_to_xyz(color, space):
+    """
+    Translate an RGB tuple to a tuple of channel values in any colorspace.
+    """
+    try:
+        func, _ = RGB_TO_XYZ[space]
+    except (KeyError, TypeError):
+        raise ValueError(f'Invalid colorspace {space}.')
+    return tuple(func(*color))
+
+
+def _to_rgb_array(colors, space='rgb'):
+    """
+    Translate an (N, 3) array of channel values from any colorspace to RGB.
+    This is a vectorized version of `to_rgb` for tuples of numbers.
+    """
+    colors = np.array(colors, dtype=float).reshape(-1, 3)
+    if space == 'rgb':
+        scale = (colors > 2).any(axis=1)
+        colors[scale] /= 255  # scale to within 0-1
+        return colors
+    if space in ('hsv', 'hcl', 'hsl', 'hpl'):
+        from .internals import accel
+        return accel.to_rgb(colors, space)
+    try:
+        _, func = XYZ_TO_RGB[space]
+    except (KeyError, TypeError):
+        raise ValueError(f'Invalid colorspace {space!r}.')
+    return func(colors)
+
+
+def _to_xyz_array(colors, space='hcl'):
+    """
+    Translate an (N, 3) array of RGB channel values to any colorspace.
+    This is a vectorized version of `to_xyz` for tuples of numbers.
+    """
+    colors = np.array(colors, dtype=float).reshape(-1, 3)
+    if space == 'rgb':
+        return colors
+    try:
+        _, func = RGB_TO_XYZ[space]
+    except (KeyError, TypeError):
+        raise ValueError(f'Invalid colorspace {space!r}.')
+    return func(colors)
+
+
 @warnings._rename_kwargs('0.6', units='dest')
 def units(value, dest='in', axes=None, figure=None, width=True):
     """